@@ -9,13 +9,13 @@ including validation, interactions, and advanced AI model generation.
 import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the project root to path so the src package can be imported
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from ai_model_manager import AIModelManager, TraitInteraction
-    from ck3_trigger_generator import CK3TriggerGenerator
-    from model_organizer import ModelOrganizer
+    from src.ai_model_manager import AIModelManager, TraitInteraction
+    from src.ck3_trigger_generator import CK3TriggerGenerator
+    from src.model_organizer import ModelOrganizer
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please run this script from the project root directory")
@@ -26,7 +26,7 @@ def main():
     """Demonstrate the enhanced trait integration system."""
     print("=== Enhanced CK3 AI Weight Generator - Trait Integration Demo ===\n")
     
-    # Initialize the system
+    # Initialize the system once, every step below reuses this manager
     print("1. Initializing AI Model Manager with trait system...")
     ai_manager = AIModelManager()
     
@@ -38,19 +38,16 @@ def main():
     print(f"Loaded {ai_manager.trait_manager.get_interaction_count()} trait interactions from JSON files")
     all_interactions = ai_manager.get_trait_interactions()
     
-    # Show breakdown by interaction type
-    synergies = [i for i in all_interactions if i.interaction_type == "synergy"]
-    antagonisms = [i for i in all_interactions if i.interaction_type == "antagonism"]
-    conditionals = [i for i in all_interactions if i.interaction_type == "conditional"]
-    
-    print(f"  - {len(synergies)} synergistic interactions")
-    print(f"  - {len(antagonisms)} antagonistic interactions")
-    print(f"  - {len(conditionals)} conditional interactions")
+    # Show breakdown by interaction type, the trait manager keeps them indexed
+    trait_manager = ai_manager.trait_manager
+    print(f"  - {len(trait_manager.get_interactions_by_type('synergy'))} synergistic interactions")
+    print(f"  - {len(trait_manager.get_interactions_by_type('antagonism'))} antagonistic interactions")
+    print(f"  - {len(trait_manager.get_interactions_by_type('conditional'))} conditional interactions")
     
     # Show some example interactions
     print("\nExample interactions loaded from JSON:")
     for i, interaction in enumerate(all_interactions[:5]):
-        print(f"  {i+1}. {' + '.join(interaction.trait_combination)} ({interaction.interaction_type})")
+        print(f"  {i+1}. {interaction.combination_label} ({interaction.interaction_type})")
         print(f"     {interaction.description} ({interaction.weight_modifier:+d})")
     
     if len(all_interactions) > 5:
@@ -125,8 +122,8 @@ def main():
     print(f"Added custom interaction: {custom_interaction.description}")
     print(f"New total interactions: {ai_manager.trait_manager.get_interaction_count()}")
     
-    # Rebuild models to include the new interaction
-    ai_manager.rebuild_models(force=True)
+    # Rebuild only the models that have every trait of the new interaction
+    ai_manager.rebuild_models()
     
     print("\n" + "="*60)
     
@@ -135,49 +132,47 @@ def main():
     trigger_generator = CK3TriggerGenerator()
     
     # Generate triggers for all models
-    for model_name in ai_manager.list_models():
-        model = ai_manager.get_model(model_name)
-        if model:
-            print(f"\n--- Trigger for {model_name.upper()} ---")
-            trigger = trigger_generator.generate_comprehensive_trigger(model, ai_manager)
-            
-            # Display trigger information
-            print(f"Model: {trigger.model_name}")
-            print(f"Total Weight: {trigger.weight}")
-            print(f"Description: {trigger.description}")
-            
-            if trigger.trait_conditions:
-                print(f"Trait Conditions ({len(trigger.trait_conditions)}):")
-                for condition in trigger.trait_conditions[:3]:  # Show first 3
-                    print(f"  - {condition}")
-                if len(trigger.trait_conditions) > 3:
-                    print(f"  ... and {len(trigger.trait_conditions) - 3} more")
-            
-            if trigger.interaction_conditions:
-                print(f"Interaction Conditions ({len(trigger.interaction_conditions)}):")
-                for condition in trigger.interaction_conditions[:2]:  # Show first 2
-                    print(f"  - {condition}")
-                if len(trigger.interaction_conditions) > 2:
-                    print(f"  ... and {len(trigger.interaction_conditions) - 2} more")
-            
-            # Show formatted trigger block
-            print("\nFormatted CK3 Trigger:")
-            formatted_trigger = trigger_generator.format_trigger_block(trigger, f"{model_name}_event")
-            print(formatted_trigger[:400] + "..." if len(formatted_trigger) > 400 else formatted_trigger)
-            print()
+    for model_name, model in ai_manager.iter_models():
+        print(f"\n--- Trigger for {model_name.upper()} ---")
+        trigger = trigger_generator.generate_comprehensive_trigger(model, ai_manager)
+        
+        # Display trigger information
+        print(f"Model: {trigger.model_name}")
+        print(f"Total Weight: {trigger.weight}")
+        print(f"Description: {trigger.description}")
+        
+        if trigger.trait_conditions:
+            print(f"Trait Conditions ({len(trigger.trait_conditions)}):")
+            for condition in trigger.trait_conditions[:3]:  # Show first 3
+                print(f"  - {condition}")
+            if len(trigger.trait_conditions) > 3:
+                print(f"  ... and {len(trigger.trait_conditions) - 3} more")
+        
+        if trigger.interaction_conditions:
+            print(f"Interaction Conditions ({len(trigger.interaction_conditions)}):")
+            for condition in trigger.interaction_conditions[:2]:  # Show first 2
+                print(f"  - {condition}")
+            if len(trigger.interaction_conditions) > 2:
+                print(f"  ... and {len(trigger.interaction_conditions) - 2} more")
+        
+        # Show formatted trigger block
+        print("\nFormatted CK3 Trigger:")
+        formatted_trigger = trigger_generator.format_trigger_block(trigger, f"{model_name}_event")
+        print(formatted_trigger[:400] + "..." if len(formatted_trigger) > 400 else formatted_trigger)
+        print()
     
     print("\n" + "="*60)
     
     # Demonstrate model organizer integration
     print("\n6. Using enhanced model organizer...")
-    organizer = ModelOrganizer()
+    organizer = ModelOrganizer(ai_manager)
     
     # Validate trait references with new system
-    validation = organizer.validate_trait_references()
+    validation = organizer.validate_trait_references(counts_only=True)
     print("Model Validation Summary:")
-    print(f"  Valid Models: {len(validation['valid_models'])}")
-    print(f"  Models with Missing Traits: {len(validation['missing_traits'])}")
-    print(f"  Unused Traits: {len(validation['unused_traits'])}")
+    print(f"  Valid Models: {validation['valid_models_count']}")
+    print(f"  Models with Missing Traits: {validation['missing_traits_count']}")
+    print(f"  Unused Traits: {validation['unused_traits_count']}")
     
     # Export enhanced documentation
     print("\n7. Exporting enhanced documentation...")
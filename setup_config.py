@@ -6,12 +6,12 @@ This script helps users set up their configuration for the CK3 AI Weight Generat
 including CK3 mod folder detection and project configuration.
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict
 
 from src.config_manager import ConfigManager
+from src.json_utils import load_json, write_json
 
 
 def create_user_config() -> bool:
@@ -48,31 +48,33 @@ def detect_ck3_paths() -> Dict[str, str]:
         Dictionary of detected paths
     """
     paths = {}
+    home = Path.home()
     
     # Common Steam Workshop paths
     steam_paths = [
-        "~/.steam/steam/steamapps/workshop/content/1158310",
-        "C:/Program Files (x86)/Steam/steamapps/workshop/content/1158310",
-        "C:/Steam/steamapps/workshop/content/1158310"
+        home / ".steam/steam/steamapps/workshop/content/1158310",
+        Path("C:/Program Files (x86)/Steam/steamapps/workshop/content/1158310"),
+        Path("C:/Steam/steamapps/workshop/content/1158310")
     ]
     
     for path in steam_paths:
-        expanded_path = Path(path).expanduser()
-        if expanded_path.exists():
-            paths["steam_workshop"] = str(expanded_path)
+        if path.exists():
+            paths["steam_workshop"] = str(path)
             break
     
-    # Common Paradox mod paths
+    # Common Paradox mod paths, including the documents of every Windows user
+    paradox_mod_dir = "Documents/Paradox Interactive/Crusader Kings III/mod"
     paradox_paths = [
-        "~/.local/share/Paradox Interactive/Crusader Kings III/mod",
-        "~/Documents/Paradox Interactive/Crusader Kings III/mod",
-        "C:/Users/*/Documents/Paradox Interactive/Crusader Kings III/mod"
+        home / ".local/share/Paradox Interactive/Crusader Kings III/mod",
+        home / paradox_mod_dir
     ]
+    windows_users = Path("C:/Users")
+    if windows_users.is_dir():
+        paradox_paths.extend(sorted(windows_users.glob(f"*/{paradox_mod_dir}")))
     
     for path in paradox_paths:
-        expanded_path = Path(path).expanduser()
-        if expanded_path.exists():
-            paths["paradox_mods"] = str(expanded_path)
+        if path.exists():
+            paths["paradox_mods"] = str(path)
             break
     
     return paths
@@ -91,8 +93,7 @@ def update_config_with_paths(config_file: Path, paths: Dict[str, str]) -> bool:
     """
     try:
         # Read current config
-        with open(config_file, 'r', encoding='utf-8') as file:
-            config = json.load(file)
+        config = load_json(config_file)
         
         # Update CK3 mod config section
         if "ck3_mod_config" not in config:
@@ -109,8 +110,7 @@ def update_config_with_paths(config_file: Path, paths: Dict[str, str]) -> bool:
             ck3_config["use_paradox_mods"] = True
         
         # Write updated config
-        with open(config_file, 'w', encoding='utf-8') as file:
-            json.dump(config, file, indent=2, ensure_ascii=False)
+        write_json(config_file, config)
         
         return True
         
@@ -131,8 +131,7 @@ def interactive_project_setup(config_file: Path) -> bool:
     """
     try:
         # Read current config
-        with open(config_file, 'r', encoding='utf-8') as file:
-            config = json.load(file)
+        config = load_json(config_file)
         
         print("\nMod Configuration:")
         print("=" * 30)
@@ -161,8 +160,7 @@ def interactive_project_setup(config_file: Path) -> bool:
         mod_config["author"] = author
         
         # Write updated config
-        with open(config_file, 'w', encoding='utf-8') as file:
-            json.dump(config, file, indent=2, ensure_ascii=False)
+        write_json(config_file, config)
         
         print(f"\nMod configured:")
         print(f"  Name: {mod_name}")
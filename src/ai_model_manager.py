@@ -6,12 +6,176 @@ that will be used to generate CK3 triggers using the trait-based system.
 """
 
 import json
-from dataclasses import dataclass
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
+from .dataclass_utils import add_slots
+from .json_utils import decode_json, encode_json, load_json
 
-@dataclass
+
+# Loaded traits and models are cached in this subdirectory of their JSON directory
+MODEL_CACHE_DIR = ".cache"
+
+# Bump when the cached classes change so old cache files are ignored
+MODEL_CACHE_VERSION = 4
+
+# Directories with fewer JSON files than this are loaded in the current thread
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Bit flags for the trait lists of a character model, a trait in several lists conflicts
+POSITIVE_TRAIT, NEGATIVE_TRAIT, OPPOSITE_TRAIT = 1, 2, 4
+
+# Conflict reason for each pair of trait lists a trait can appear in together
+TRAIT_LIST_CONFLICTS: Tuple[Tuple[int, str], ...] = (
+    (POSITIVE_TRAIT | NEGATIVE_TRAIT, "both positive and negative"),
+    (POSITIVE_TRAIT | OPPOSITE_TRAIT, "both positive and opposite"),
+    (NEGATIVE_TRAIT | OPPOSITE_TRAIT, "both negative and opposite"),
+)
+
+T = TypeVar('T')
+
+# Encoded cache data already read or written in this process, keyed by absolute
+# cache file path, so further managers skip the file but still get fresh objects
+_loaded_model_caches: Dict[str, Tuple[List[Tuple[str, int, int]], bytes]] = {}
+
+
+def _write_messages(messages: List[str]) -> None:
+    """Write messages collected while loading to stdout in a single call."""
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
+
+
+def _map_json_files(load_file: Callable[[Path], T], json_files: List[Path]) -> List[T]:
+    """
+    Load JSON files independently, in threads for larger directories.
+    
+    Args:
+        load_file: Function loading one file, must not change shared state
+        json_files: JSON files to load
+        
+    Returns:
+        Results of load_file in the order of json_files
+    """
+    if len(json_files) >= PARALLEL_LOAD_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(json_files))) as executor:
+            return list(executor.map(load_file, json_files))
+    return [load_file(json_file) for json_file in json_files]
+
+
+def _intern_text(value: Any) -> Any:
+    """Intern a string read from JSON, other values are returned unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_names(names: Any) -> Any:
+    """
+    Intern the trait names of a JSON list so equal names share one string.
+    
+    Args:
+        names: Value read from JSON, only lists are changed
+        
+    Returns:
+        List with interned string items, or the value unchanged
+    """
+    if not isinstance(names, list):
+        return names
+    return [_intern_text(name) for name in names]
+
+
+def _scan_json_files(directory: Path) -> Tuple[List[Path], List[Tuple[str, int, int]]]:
+    """
+    List the JSON files of a directory along with their cache signature.
+    
+    Matches the files of directory.glob("*.json"), in the same order, while
+    reading each directory entry only once.
+    
+    Args:
+        directory: Directory to scan
+        
+    Returns:
+        Tuple of (JSON files in load order, list of (file name, mtime_ns, size) tuples)
+    """
+    json_files = []
+    signature = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".json") and not name.startswith(".") and entry.is_file():
+                stat = entry.stat()
+                json_files.append(Path(entry.path))
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+    return json_files, signature
+
+
+def _load_model_cache(cache_file: Path, signature: List[Tuple[str, int, int]]) -> Optional[Any]:
+    """
+    Load previously loaded data if the JSON files have not changed since.
+    
+    The cache only holds plain JSON data, which the caller turns back into
+    objects, so reading it never runs code from the data directory.
+    
+    Args:
+        cache_file: Path to the JSON cache file
+        signature: Signature of the JSON files as they are now
+        
+    Returns:
+        Cached data, or None if there is no usable cache
+    """
+    key = str(cache_file.absolute())
+    loaded = _loaded_model_caches.get(key)
+    if loaded is not None and loaded[0] == signature:
+        return decode_json(loaded[1])['data']
+    
+    if not cache_file.exists():
+        return None
+    
+    try:
+        encoded = cache_file.read_bytes()
+        cached = decode_json(encoded)
+        # JSON has no tuples, so the signature is compared as lists
+        if (not isinstance(cached, dict) or cached.get('version') != MODEL_CACHE_VERSION
+                or cached.get('signature') != [list(entry) for entry in signature]
+                or 'data' not in cached):
+            return None
+        _loaded_model_caches[key] = (signature, encoded)
+        return cached['data']
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache {cache_file}: {e}")
+        return None
+
+
+def _save_model_cache(cache_file: Path, signature: List[Tuple[str, int, int]], data: Any) -> None:
+    """
+    Write loaded data to the cache file atomically.
+    
+    Args:
+        cache_file: Path to the JSON cache file
+        signature: Signature of the JSON files the data was loaded from
+        data: JSON serializable data to cache
+    """
+    encoded = encode_json({'version': MODEL_CACHE_VERSION, 'signature': signature, 'data': data}, indent=False)
+    _loaded_model_caches[str(cache_file.absolute())] = (signature, encoded)
+    
+    temp_path = cache_file.with_name(cache_file.name + '.tmp')
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        temp_path.write_bytes(encoded)
+        os.replace(temp_path, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_file}: {e}")
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+@add_slots
+@dataclass(frozen=True)
 class AIModifier:
     """Represents a single AI modifier with condition identifier and weight adjustment."""
     condition_identifier: Optional[str] = None
@@ -20,6 +184,7 @@ class AIModifier:
     weight_adjustment: int = 0
 
 
+@add_slots
 @dataclass
 class TraitDefinition:
     """Represents a trait definition with its effects and opposite traits."""
@@ -30,6 +195,7 @@ class TraitDefinition:
     opposite_traits: List[str]
 
 
+@add_slots
 @dataclass
 class AIModelParameters:
     """Represents the parameters for an AI model."""
@@ -37,6 +203,7 @@ class AIModelParameters:
     modifiers: List[AIModifier]
 
 
+@add_slots
 @dataclass
 class AIModel:
     """Represents a complete AI model with description and parameters."""
@@ -45,6 +212,7 @@ class AIModel:
     parameters: AIModelParameters
 
 
+@add_slots
 @dataclass
 class CharacterModel:
     """Represents a character model that references traits."""
@@ -54,9 +222,37 @@ class CharacterModel:
     traits: Dict[str, List[str]]  # positive and negative traits
     opposite_traits: List[str]
     modifiers: List[AIModifier]
+    # Markdown documentation, built on first use since models do not change after loading
+    _documentation: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Start without documentation, slotted instances have no class default to fall back on."""
+        self._documentation = None
+    
+    @property
+    def documentation(self) -> str:
+        """Markdown section describing the model, its traits and modifier count."""
+        if self._documentation is None:
+            parts = [
+                f"### {self.name.title()}\n\n",
+                f"**Description**: {self.description}\n\n",
+                f"**Base Weight**: {self.base_weight}\n\n"
+            ]
+            positive_traits = self.traits.get('positive', [])
+            negative_traits = self.traits.get('negative', [])
+            if positive_traits:
+                parts.append(f"**Positive Traits**: {', '.join(positive_traits)}\n\n")
+            if negative_traits:
+                parts.append(f"**Negative Traits**: {', '.join(negative_traits)}\n\n")
+            if self.opposite_traits:
+                parts.append(f"**Opposite Traits**: {', '.join(self.opposite_traits)}\n\n")
+            parts.append(f"**Modifiers**: {len(self.modifiers)} conditions\n\n")
+            self._documentation = "".join(parts)
+        return self._documentation
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class TraitInteraction:
     """Represents an interaction between two or more traits."""
     trait_combination: List[str]
@@ -64,8 +260,17 @@ class TraitInteraction:
     weight_modifier: int
     description: str
     conditions: Optional[List[str]] = None  # Optional CK3 conditions for conditional interactions
+    # Derived from trait_combination once, at construction
+    combination_label: str = field(init=False, repr=False, compare=False)
+    trait_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the display label and trait set of the combination."""
+        object.__setattr__(self, 'combination_label', " + ".join(self.trait_combination))
+        object.__setattr__(self, 'trait_set', frozenset(self.trait_combination))
 
 
+@add_slots
 @dataclass
 class TraitValidationResult:
     """Represents the result of trait validation for a character model."""
@@ -91,47 +296,147 @@ class TraitManager:
         self.traits_dir = Path(traits_dir)
         self.traits: Dict[str, TraitDefinition] = {}
         self.trait_interactions: List[TraitInteraction] = []
+        self._interactions_by_type: Dict[str, List[TraitInteraction]] = defaultdict(list)
+        # Detected interactions keyed by trait set, cleared when interactions change
+        self._interaction_cache: Dict[FrozenSet[str], List[TraitInteraction]] = {}
+        # Positions in trait_interactions keyed by one trait of each combination,
+        # an interaction can only apply to trait sets containing that trait
+        self._interactions_by_trait: Dict[str, List[int]] = defaultdict(list)
+        self._interactions_without_traits: List[int] = []
+        # Fewest distinct traits any interaction needs, None until one is added
+        self._min_interaction_size: Optional[int] = None
+        # Opposites of each trait in either direction, both traits being defined,
+        # indexed on first use as only validation needs them
+        self._opposites_by_trait: Optional[Dict[str, FrozenSet[str]]] = None
         self._load_traits()
     
     def _load_traits(self) -> None:
         """Load trait definitions and interactions from all JSON files in the traits directory."""
-        if not self.traits_dir.exists():
+        try:
+            json_files, signature = _scan_json_files(self.traits_dir)
+        except FileNotFoundError:
             print(f"Warning: Traits directory not found: {self.traits_dir}")
             return
         
-        json_files = list(self.traits_dir.glob("*.json"))
-        
         if not json_files:
             print(f"Warning: No JSON files found in traits directory: {self.traits_dir}")
             return
         
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                
-                # Load traits
-                if 'traits' in data:
-                    for trait_name, trait_data in data['traits'].items():
-                        if isinstance(trait_data, dict):
-                            self.traits[trait_name] = self._create_trait_from_data(trait_name, trait_data)
-                
-                # Load trait interactions
-                if 'interactions' in data:
-                    for interaction_data in data['interactions']:
-                        if isinstance(interaction_data, dict):
-                            interaction = self._create_interaction_from_data(interaction_data)
-                            if interaction:
-                                self.trait_interactions.append(interaction)
-                
-                print(f"Loaded traits and interactions from {json_file.name}")
-                
-            except json.JSONDecodeError as e:
-                print(f"Warning: Invalid JSON in {json_file.name}: {e}")
-                continue
-            except Exception as e:
-                print(f"Warning: Error loading traits from {json_file.name}: {e}")
-                continue
+        # Reuse the traits of the previous run if no trait file has changed
+        cache_file = self.traits_dir / MODEL_CACHE_DIR / "traits.json"
+        cached = _load_model_cache(cache_file, signature)
+        if cached is not None and self._restore_trait_cache(cache_file, cached):
+            return
+        
+        # Files are loaded independently and merged in order, messages are
+        # written once at the end instead of a print per file
+        messages: List[str] = []
+        try:
+            for file_traits, file_interactions, file_messages in _map_json_files(self._load_trait_file, json_files):
+                self.traits.update(file_traits)
+                for interaction in file_interactions:
+                    self.add_interaction(interaction)
+                messages.extend(file_messages)
+        finally:
+            _write_messages(messages)
+        
+        _save_model_cache(cache_file, signature, {
+            'traits': {trait_name: self._trait_to_data(trait) for trait_name, trait in self.traits.items()},
+            'interactions': [self._interaction_to_data(interaction) for interaction in self.trait_interactions],
+            'messages': messages,
+        })
+    
+    def _restore_trait_cache(self, cache_file: Path, cached: Dict[str, Any]) -> bool:
+        """
+        Recreate the traits and interactions stored in the trait cache.
+        
+        Args:
+            cache_file: Path to the cache file, for the warning
+            cached: Data read from the cache file
+            
+        Returns:
+            True if the cache was used, False if the JSON files need to be loaded
+        """
+        try:
+            messages = list(cached['messages'])
+            traits = {
+                sys.intern(trait_name): self._create_trait_from_data(sys.intern(trait_name), trait_data)
+                for trait_name, trait_data in cached['traits'].items()
+            }
+            interactions = [
+                self._create_interaction_from_data(interaction_data, messages)
+                for interaction_data in cached['interactions']
+            ]
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache {cache_file}: {e}")
+            return False
+        
+        self.traits = traits
+        for interaction in interactions:
+            if interaction:
+                self.add_interaction(interaction)
+        _write_messages(messages)
+        return True
+    
+    def _get_opposites_by_trait(self) -> Dict[str, FrozenSet[str]]:
+        """Get the opposite trait index, building it on first use."""
+        if self._opposites_by_trait is None:
+            self._opposites_by_trait = self._index_opposite_traits()
+        return self._opposites_by_trait
+    
+    def _index_opposite_traits(self) -> Dict[str, FrozenSet[str]]:
+        """Index the opposite trait relation of the loaded traits in both directions."""
+        opposites: Dict[str, Set[str]] = defaultdict(set)
+        for trait_name, trait in self.traits.items():
+            for opposite_name in trait.opposite_traits:
+                if opposite_name in self.traits:
+                    opposites[trait_name].add(opposite_name)
+                    opposites[opposite_name].add(trait_name)
+        return {trait_name: frozenset(names) for trait_name, names in opposites.items()}
+    
+    def _load_trait_file(
+        self,
+        json_file: Path
+    ) -> Tuple[Dict[str, TraitDefinition], List[TraitInteraction], List[str]]:
+        """
+        Load the traits and interactions of one JSON file without changing the manager.
+        
+        Args:
+            json_file: Path to the trait JSON file
+            
+        Returns:
+            Tuple of (traits, interactions, messages) read from the file, partial
+            if the file could not be loaded completely
+        """
+        traits: Dict[str, TraitDefinition] = {}
+        interactions: List[TraitInteraction] = []
+        messages: List[str] = []
+        try:
+            data = load_json(json_file)
+            
+            # Load traits
+            if 'traits' in data:
+                for trait_name, trait_data in data['traits'].items():
+                    if isinstance(trait_data, dict):
+                        trait_name = sys.intern(trait_name)
+                        traits[trait_name] = self._create_trait_from_data(trait_name, trait_data)
+            
+            # Load trait interactions
+            if 'interactions' in data:
+                for interaction_data in data['interactions']:
+                    if isinstance(interaction_data, dict):
+                        interaction = self._create_interaction_from_data(interaction_data, messages)
+                        if interaction:
+                            interactions.append(interaction)
+            
+            messages.append(f"Loaded traits and interactions from {json_file.name}")
+            
+        except json.JSONDecodeError as e:
+            messages.append(f"Warning: Invalid JSON in {json_file.name}: {e}")
+        except Exception as e:
+            messages.append(f"Warning: Error loading traits from {json_file.name}: {e}")
+        
+        return traits, interactions, messages
     
     def _create_trait_from_data(self, name: str, data: Dict[str, Any]) -> TraitDefinition:
         """Create a TraitDefinition instance from dictionary data."""
@@ -140,27 +445,69 @@ class TraitManager:
             description=data.get('description', ''),
             weight=data.get('weight', 0),
             ai_effects=data.get('ai_effects', {}),
-            opposite_traits=data.get('opposite_traits', [])
+            opposite_traits=_intern_names(data.get('opposite_traits', []))
         )
     
-    def _create_interaction_from_data(self, data: Dict[str, Any]) -> Optional[TraitInteraction]:
-        """Create a TraitInteraction instance from dictionary data."""
+    @staticmethod
+    def _trait_to_data(trait: TraitDefinition) -> Dict[str, Any]:
+        """Convert a TraitDefinition to the dictionary data it is created from."""
+        return {
+            'description': trait.description,
+            'weight': trait.weight,
+            'ai_effects': trait.ai_effects,
+            'opposite_traits': trait.opposite_traits
+        }
+    
+    @staticmethod
+    def _interaction_to_data(interaction: TraitInteraction) -> Dict[str, Any]:
+        """Convert a TraitInteraction to the dictionary data it is created from."""
+        return {
+            'trait_combination': interaction.trait_combination,
+            'interaction_type': interaction.interaction_type,
+            'weight_modifier': interaction.weight_modifier,
+            'description': interaction.description,
+            'conditions': interaction.conditions
+        }
+    
+    def _create_interaction_from_data(
+        self,
+        data: Dict[str, Any],
+        messages: Optional[List[str]] = None
+    ) -> Optional[TraitInteraction]:
+        """Create a TraitInteraction instance from dictionary data, warnings go to messages if given."""
         try:
             return TraitInteraction(
-                trait_combination=data.get('trait_combination', []),
+                trait_combination=_intern_names(data.get('trait_combination', [])),
                 interaction_type=data.get('interaction_type', 'synergy'),
                 weight_modifier=data.get('weight_modifier', 0),
                 description=data.get('description', ''),
                 conditions=data.get('conditions', None)
             )
         except Exception as e:
-            print(f"Warning: Error creating interaction from data: {e}")
+            warning = f"Warning: Error creating interaction from data: {e}"
+            if messages is None:
+                print(warning)
+            else:
+                messages.append(warning)
             return None
     
     def get_trait(self, trait_name: str) -> Optional[TraitDefinition]:
         """Get a trait definition by name."""
         return self.traits.get(trait_name)
     
+    def get_traits(self, trait_names: Iterable[str]) -> Dict[str, Optional[TraitDefinition]]:
+        """
+        Get several trait definitions in one call.
+        
+        Args:
+            trait_names: Names of the traits to look up
+            
+        Returns:
+            Dictionary mapping each name to its definition, or None if unknown
+        """
+        traits = self.traits
+        return {trait_name: traits.get(trait_name) for trait_name in trait_names}
+    
     def list_traits(self) -> List[str]:
         """Get a list of all available trait names."""
         return list(self.traits.keys())
@@ -182,21 +529,33 @@ class TraitManager:
     
     def are_traits_compatible(self, trait1: str, trait2: str) -> bool:
         """Check if two traits are compatible (not opposites of each other)."""
-        trait1_def = self.get_trait(trait1)
-        trait2_def = self.get_trait(trait2)
-        
-        if not trait1_def or not trait2_def:
-            return True  # Unknown traits are assumed compatible
-        
-        # Check if trait2 is in trait1's opposite traits
-        if trait2 in trait1_def.opposite_traits:
-            return False
+        # The index holds opposites in both directions and only between known
+        # traits, unknown traits are assumed compatible
+        return trait2 not in self._get_opposites_by_trait().get(trait1, ())
+    
+    def find_opposite_trait_pairs(self, trait_names: List[str]) -> List[Tuple[str, str]]:
+        """
+        Find the pairs of traits in a list that are opposites of each other.
         
-        # Check if trait1 is in trait2's opposite traits
-        if trait1 in trait2_def.opposite_traits:
-            return False
+        Gives the same pairs as calling are_traits_compatible on every pair,
+        but only visits the opposites of each trait.
         
-        return True
+        Args:
+            trait_names: Distinct trait names to check
+            
+        Returns:
+            List of (trait1, trait2) tuples, ordered as the pairs of trait_names
+        """
+        opposites_by_trait = self._get_opposites_by_trait()
+        positions = {trait_name: i for i, trait_name in enumerate(trait_names)}
+        pairs = []
+        for i, trait_name in enumerate(trait_names):
+            opposites = opposites_by_trait.get(trait_name)
+            if not opposites:
+                continue
+            later = sorted(positions[name] for name in opposites & positions.keys() if positions[name] > i)
+            pairs.extend((trait_name, trait_names[j]) for j in later)
+        return pairs
     
     def get_trait_interactions(self) -> List[TraitInteraction]:
         """
@@ -207,6 +566,18 @@ class TraitManager:
         """
         return self.trait_interactions.copy()
     
+    def get_interactions_by_type(self, interaction_type: str) -> List[TraitInteraction]:
+        """
+        Get the trait interactions of one type.
+        
+        Args:
+            interaction_type: Interaction type, e.g. "synergy" or "antagonism"
+            
+        Returns:
+            List of interactions with that type
+        """
+        return list(self._interactions_by_type.get(interaction_type, ()))
+    
     def get_interaction_count(self) -> int:
         """
         Get the total number of trait interactions.
@@ -226,17 +597,44 @@ class TraitManager:
         Returns:
             List of applicable trait interactions
         """
-        detected_interactions = []
-        trait_set = set(traits)
-        
-        for interaction in self.trait_interactions:
-            interaction_traits = set(interaction.trait_combination)
-            
-            # Check if all traits in the interaction are present
-            if interaction_traits.issubset(trait_set):
-                detected_interactions.append(interaction)
-        
-        return detected_interactions
+        trait_set = frozenset(traits)
+        
+        # Too few traits for even the smallest combination to match
+        if self._min_interaction_size is None or len(trait_set) < self._min_interaction_size:
+            return []
+        
+        cached = self._interaction_cache.get(trait_set)
+        if cached is not None:
+            return list(cached)
+        
+        # Only interactions indexed under one of the traits can apply, checked in load order
+        candidates = list(self._interactions_without_traits)
+        for trait_name in trait_set:
+            candidates.extend(self._interactions_by_trait.get(trait_name, ()))
+        candidates.sort()
+        
+        interactions = self.trait_interactions
+        detected_interactions = [
+            interactions[index] for index in candidates
+            if interactions[index].trait_set <= trait_set
+        ]
+        
+        self._interaction_cache[trait_set] = detected_interactions
+        return list(detected_interactions)
+    
+    def add_interaction(self, interaction: TraitInteraction) -> None:
+        """Add a trait interaction and drop previously detected interactions."""
+        index = len(self.trait_interactions)
+        self.trait_interactions.append(interaction)
+        if interaction.trait_set:
+            self._interactions_by_trait[min(interaction.trait_set)].append(index)
+        else:
+            self._interactions_without_traits.append(index)
+        size = len(interaction.trait_set)
+        if self._min_interaction_size is None or size < self._min_interaction_size:
+            self._min_interaction_size = size
+        self._interactions_by_type[interaction.interaction_type].append(interaction)
+        self._interaction_cache.clear()
     
     def calculate_trait_interaction_weight(self, traits: List[str]) -> int:
         """
@@ -249,12 +647,7 @@ class TraitManager:
             Total weight adjustment from interactions
         """
         interactions = self.detect_trait_interactions(traits)
-        total_adjustment = 0
-        
-        for interaction in interactions:
-            total_adjustment += interaction.weight_modifier
-        
-        return total_adjustment
+        return sum(interaction.weight_modifier for interaction in interactions)
 
 
 class AIModelManager:
@@ -279,6 +672,20 @@ class AIModelManager:
         self.character_models: Dict[str, CharacterModel] = {}
         self.models: Dict[str, AIModel] = {}  # Final unified models
         self._unified_models_cache: Optional[Dict[str, AIModel]] = None
+        # Character models referencing each trait, and models waiting for a rebuild
+        self._models_by_trait: Dict[str, Set[str]] = {}
+        self._stale_models: Set[str] = set()
+        # Validation results per character model, dropped when their inputs change,
+        # and the trait and model file signature the results were computed for
+        self._validation_cache: Dict[str, TraitValidationResult] = {}
+        self._validation_signature: Optional[List[List[Tuple[str, int, int]]]] = None
+        # Summed positive, negative and opposite trait weights per character model
+        self._trait_weight_sums: Dict[str, Tuple[int, int, int]] = {}
+        # Shared modifier instances, unified models repeat the same trait modifiers
+        self._modifiers: Dict[Tuple[Any, ...], AIModifier] = {}
+        # Trait modifiers shared by every model listing the trait, built on first use
+        self._positive_trait_modifiers: Dict[str, Tuple[AIModifier, ...]] = {}
+        self._against_trait_modifiers: Dict[str, Optional[AIModifier]] = {}
         self._load_models()
         self._build_unified_models()
     
@@ -310,12 +717,23 @@ class AIModelManager:
         """
         Add a custom trait interaction to the system.
         
+        Only the unified models of character models having every trait of
+        the combination, every model for an empty combination, are dropped
+        from the cache and marked for rebuild. The cache stays valid when
+        the interaction affects no loaded model.
+        
         Args:
             interaction: TraitInteraction to add
         """
-        self.trait_manager.trait_interactions.append(interaction)
-        # Invalidate cache since interactions have changed
-        self._unified_models_cache = None
+        self.trait_manager.add_interaction(interaction)
+        # Only models having every trait of the combination can be affected
+        affected_models = self._get_models_using_traits(interaction.trait_combination, match_all=True)
+        self._stale_models.update(affected_models)
+        for model_name in affected_models:
+            self._validation_cache.pop(model_name, None)
+        if self._unified_models_cache is not None:
+            for model_name in affected_models:
+                self._unified_models_cache.pop(model_name, None)
         print(f"Added custom trait interaction: {interaction.description}")
     
     def get_trait_interactions(self) -> List[TraitInteraction]:
@@ -331,205 +749,464 @@ class AIModelManager:
         """Load character models from all JSON files in the models directory."""
         models_dir = self.models_file_path.parent
         
-        if not models_dir.exists():
-            raise FileNotFoundError(f"Models directory not found: {models_dir}")
-        
         # Load all JSON files in the models directory
-        json_files = list(models_dir.glob("*.json"))
+        try:
+            json_files, signature = _scan_json_files(models_dir)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Models directory not found: {models_dir}") from None
         
         if not json_files:
             raise FileNotFoundError(f"No JSON files found in models directory: {models_dir}")
         
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
+        # Reuse the character models of the previous run if no model file has changed
+        cache_file = models_dir / MODEL_CACHE_DIR / "characters.json"
+        cached = _load_model_cache(cache_file, signature)
+        if cached is not None and self._restore_model_cache(cache_file, cached):
+            return
+        
+        # Files are loaded independently and merged in order, messages are
+        # written once at the end instead of a print per file
+        messages: List[str] = []
+        try:
+            for file_models, file_messages in _map_json_files(self._load_model_file, json_files):
+                self.character_models.update(file_models)
+                messages.extend(file_messages)
+        finally:
+            _write_messages(messages)
+        
+        _save_model_cache(cache_file, signature, {
+            'models': {
+                model_name: self._character_model_to_data(character_model)
+                for model_name, character_model in self.character_models.items()
+            },
+            'messages': messages,
+        })
+    
+    def _restore_model_cache(self, cache_file: Path, cached: Dict[str, Any]) -> bool:
+        """
+        Recreate the character models stored in the model cache.
+        
+        Args:
+            cache_file: Path to the cache file, for the warning
+            cached: Data read from the cache file
+            
+        Returns:
+            True if the cache was used, False if the JSON files need to be loaded
+        """
+        try:
+            messages = list(cached['messages'])
+            character_models = {
+                model_name: self._create_character_model_from_data(model_name, model_data)
+                for model_name, model_data in cached['models'].items()
+            }
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache {cache_file}: {e}")
+            return False
+        
+        self.character_models = character_models
+        _write_messages(messages)
+        return True
+    
+    def _load_model_file(self, json_file: Path) -> Tuple[Dict[str, CharacterModel], List[str]]:
+        """
+        Load the character models of one JSON file without changing the manager.
+        
+        Args:
+            json_file: Path to the character model JSON file
+            
+        Returns:
+            Tuple of (character models, messages) read from the file, partial if
+            the file could not be loaded completely
+        """
+        character_models: Dict[str, CharacterModel] = {}
+        messages: List[str] = []
+        try:
+            data = load_json(json_file)
+            
+            # Handle different JSON structures
+            if isinstance(data, dict):
+                # If the file contains a 'models' key, use that
+                if 'models' in data:
+                    models_data = data['models']
+                else:
+                    # If the file is a direct model definition, use the whole file
+                    models_data = data
                 
-                # Handle different JSON structures
-                if isinstance(data, dict):
-                    # If the file contains a 'models' key, use that
-                    if 'models' in data:
-                        models_data = data['models']
-                    else:
-                        # If the file is a direct model definition, use the whole file
-                        models_data = data
-                    
-                    # Process each model in the file
-                    for model_name, model_data in models_data.items():
-                        if isinstance(model_data, dict):
-                            # Check if this is a character model format
-                            if 'traits' in model_data:
-                                self.character_models[model_name] = self._create_character_model_from_data(model_name, model_data)
-                            else:
-                                print(f"Warning: Invalid model format for '{model_name}' in {json_file.name} - missing 'traits' field")
+                # Process each model in the file
+                for model_name, model_data in models_data.items():
+                    if isinstance(model_data, dict):
+                        # Check if this is a character model format
+                        if 'traits' in model_data:
+                            character_models[model_name] = self._create_character_model_from_data(model_name, model_data)
                         else:
-                            print(f"Warning: Invalid model data for '{model_name}' in {json_file.name}")
-                
-                elif isinstance(data, list):
-                    # If the file contains a list of models
-                    for model_data in data:
-                        if isinstance(model_data, dict) and 'name' in model_data:
-                            model_name = model_data['name']
-                            if 'traits' in model_data:
-                                self.character_models[model_name] = self._create_character_model_from_data(model_name, model_data)
-                            else:
-                                print(f"Warning: Invalid model format in {json_file.name} - missing 'traits' field")
+                            messages.append(f"Warning: Invalid model format for '{model_name}' in {json_file.name} - missing 'traits' field")
+                    else:
+                        messages.append(f"Warning: Invalid model data for '{model_name}' in {json_file.name}")
+            
+            elif isinstance(data, list):
+                # If the file contains a list of models
+                for model_data in data:
+                    if isinstance(model_data, dict) and 'name' in model_data:
+                        model_name = model_data['name']
+                        if 'traits' in model_data:
+                            character_models[model_name] = self._create_character_model_from_data(model_name, model_data)
                         else:
-                            print(f"Warning: Invalid model data in {json_file.name}")
-                
-                print(f"Loaded character models from {json_file.name}")
-                
-            except json.JSONDecodeError as e:
-                print(f"Warning: Invalid JSON in {json_file.name}: {e}")
-                continue
-            except Exception as e:
-                print(f"Warning: Error loading models from {json_file.name}: {e}")
-                continue
+                            messages.append(f"Warning: Invalid model format in {json_file.name} - missing 'traits' field")
+                    else:
+                        messages.append(f"Warning: Invalid model data in {json_file.name}")
+            
+            messages.append(f"Loaded character models from {json_file.name}")
+            
+        except json.JSONDecodeError as e:
+            messages.append(f"Warning: Invalid JSON in {json_file.name}: {e}")
+        except Exception as e:
+            messages.append(f"Warning: Error loading models from {json_file.name}: {e}")
+        
+        return character_models, messages
     
     def _create_character_model_from_data(self, name: str, data: Dict[str, Any]) -> CharacterModel:
         """Create a CharacterModel instance from dictionary data."""
-        modifiers = []
-        for mod_data in data.get('modifiers', []):
-            modifier = AIModifier(
-                condition_identifier=mod_data.get('condition_identifier', None),
+        modifiers: List[AIModifier] = [
+            AIModifier(
+                condition_identifier=_intern_text(mod_data.get('condition_identifier', None)),
                 condition_values=mod_data.get('condition_values', {}),
-                condition=mod_data.get('condition', ''),
+                condition=_intern_text(mod_data.get('condition', '')),
                 weight_adjustment=mod_data.get('weight_adjustment', 0)
             )
-            modifiers.append(modifier)
+            for mod_data in data.get('modifiers', [])
+        ]
+        
+        # Trait names repeat across models, so every model shares the interned strings
+        traits = data.get('traits', {})
+        if isinstance(traits, dict):
+            traits = {trait_type: _intern_names(trait_names) for trait_type, trait_names in traits.items()}
         
         return CharacterModel(
             name=name,
             description=data.get('description', ''),
             base_weight=data.get('base_weight', 0),
-            traits=data.get('traits', {}),
-            opposite_traits=data.get('opposite_traits', []),
+            traits=traits,
+            opposite_traits=_intern_names(data.get('opposite_traits', [])),
             modifiers=modifiers
         )
     
+    @staticmethod
+    def _character_model_to_data(character_model: CharacterModel) -> Dict[str, Any]:
+        """Convert a CharacterModel to the dictionary data it is created from."""
+        return {
+            'description': character_model.description,
+            'base_weight': character_model.base_weight,
+            'traits': character_model.traits,
+            'opposite_traits': character_model.opposite_traits,
+            'modifiers': [
+                {
+                    'condition_identifier': modifier.condition_identifier,
+                    'condition_values': modifier.condition_values,
+                    'condition': modifier.condition,
+                    'weight_adjustment': modifier.weight_adjustment
+                }
+                for modifier in character_model.modifiers
+            ]
+        }
+    
     def _build_unified_models(self) -> None:
         """Build unified AIModel instances from character models and traits."""
         print("Building unified AI models from character models and traits...")
         
-        # Clear cache before rebuilding
+        # Clear cache before rebuilding, trait modifiers are rebuilt from the current traits
         self._unified_models_cache = None
+        self._clear_trait_modifiers()
+        self._trait_weight_sums.clear()
+        self._validation_cache.clear()
         
+        # One pass over the character models builds each model and indexes its traits
+        self._models_by_trait = {}
         for model_name, character_model in self.character_models.items():
-            # Calculate total base weight
-            total_base_weight = character_model.base_weight
-            
-            # Collect all modifiers
-            all_modifiers = []
-            
-            # Add character model's own modifiers
-            all_modifiers.extend(character_model.modifiers)
+            model_traits = self._get_model_traits(character_model)
+            self.models[model_name] = self._build_unified_model(character_model, model_traits)
+            for trait_name in model_traits:
+                self._models_by_trait.setdefault(trait_name, set()).add(model_name)
+        
+        self._stale_models.clear()
+        
+        # Cache the models
+        self._unified_models_cache = self.models.copy()
+        print(f"Built {len(self.models)} unified AI models with trait interactions")
+    
+    def _get_model_traits(self, character_model: CharacterModel) -> List[str]:
+        """Get the positive, negative and opposite traits of a character model."""
+        traits = character_model.traits
+        return [*traits.get('positive', []), *traits.get('negative', []), *character_model.opposite_traits]
+    
+    def _get_models_using_traits(self, trait_names: Iterable[str], match_all: bool = False) -> Set[str]:
+        """
+        Find the character models that reference the given traits.
+        
+        Args:
+            trait_names: Trait names to look up
+            match_all: If True, only models referencing every trait are returned,
+                which is every model when no traits are given
             
-            # Collect all traits for interaction analysis
-            all_model_traits = []
-            all_model_traits.extend(character_model.traits.get('positive', []))
-            all_model_traits.extend(character_model.traits.get('negative', []))
-            all_model_traits.extend(character_model.opposite_traits)
+        Returns:
+            Set of character model names
+        """
+        model_sets = [self._models_by_trait.get(trait_name, set()) for trait_name in trait_names]
+        if not model_sets:
+            return set(self.character_models) if match_all else set()
+        if match_all:
+            return set.intersection(*model_sets)
+        return set().union(*model_sets)
+    
+    def _make_modifier(
+        self,
+        condition_identifier: Optional[str] = None,
+        condition_values: Optional[Dict[str, str]] = None,
+        condition: str = "",
+        weight_adjustment: int = 0
+    ) -> AIModifier:
+        """
+        Get an AIModifier, reusing an equal one created for an earlier model.
+        
+        Modifiers are frozen and their condition values are only read, so
+        unified models can share them.
+        
+        Args:
+            condition_identifier: Condition identifier of the modifier
+            condition_values: Values for the condition identifier
+            condition: Raw condition string
+            weight_adjustment: Weight adjustment of the modifier
             
-            # Add trait interaction modifiers
-            interactions = self.detect_trait_interactions(all_model_traits)
-            for interaction in interactions:
-                if interaction.interaction_type in ["synergy", "antagonism"]:
-                    # Simple interaction - just add weight
-                    all_modifiers.append(AIModifier(
-                        condition=f"# Trait interaction: {interaction.description}",
-                        weight_adjustment=interaction.weight_modifier
-                    ))
-                elif interaction.interaction_type == "conditional" and interaction.conditions:
-                    # Conditional interaction - add with conditions
-                    condition_str = " ".join(interaction.conditions)
-                    all_modifiers.append(AIModifier(
-                        condition=condition_str,
-                        weight_adjustment=interaction.weight_modifier
-                    ))
+        Returns:
+            Shared AIModifier instance
+        """
+        key = (
+            condition_identifier,
+            None if condition_values is None else tuple(sorted(condition_values.items())),
+            condition,
+            weight_adjustment
+        )
+        modifier = self._modifiers.get(key)
+        if modifier is None:
+            modifier = AIModifier(
+                condition_identifier=condition_identifier,
+                condition_values=condition_values,
+                condition=condition,
+                weight_adjustment=weight_adjustment
+            )
+            self._modifiers[key] = modifier
+        return modifier
+    
+    def _clear_trait_modifiers(self, trait_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop cached trait modifiers so they are rebuilt from the current trait definitions.
+        
+        Args:
+            trait_names: Traits whose modifiers are dropped, all modifiers if omitted
+        """
+        if trait_names is None:
+            self._modifiers.clear()
+            self._positive_trait_modifiers.clear()
+            self._against_trait_modifiers.clear()
+            return
+        for trait_name in trait_names:
+            self._positive_trait_modifiers.pop(trait_name, None)
+            self._against_trait_modifiers.pop(trait_name, None)
+    
+    def _get_positive_trait_modifiers(self, trait_name: str) -> Tuple[AIModifier, ...]:
+        """
+        Get the modifiers a positive trait adds to a model.
+        
+        Args:
+            trait_name: Name of the positive trait
             
-            # Add trait-based modifiers
-            for trait_name in character_model.traits.get('positive', []):
-                trait = self.trait_manager.get_trait(trait_name)
-                if trait:
-                    # Add positive trait modifier using condition identifier
-                    all_modifiers.append(AIModifier(
+        Returns:
+            The trait's HAS_TRAIT modifier followed by its AI effect modifiers,
+            empty for unknown traits
+        """
+        modifiers = self._positive_trait_modifiers.get(trait_name)
+        if modifiers is None:
+            trait = self.trait_manager.traits.get(trait_name)
+            if trait is None:
+                modifiers = ()
+            else:
+                modifiers = (
+                    self._make_modifier(
                         condition_identifier="HAS_TRAIT",
                         condition_values={"trait_name": trait_name},
                         weight_adjustment=trait.weight
-                    ))
-                    
-                    # Add trait's AI effects modifiers
-                    for mod_data in trait.ai_effects.get('modifiers', []):
-                        all_modifiers.append(AIModifier(
+                    ),
+                    *(
+                        self._make_modifier(
                             condition=mod_data.get('condition', ''),
                             weight_adjustment=mod_data.get('weight_adjustment', 0)
-                        ))
-            
-            # Add negative trait modifiers (NOT conditions)
-            for trait_name in character_model.traits.get('negative', []):
-                trait = self.trait_manager.get_trait(trait_name)
-                if trait:
-                    # Add negative trait modifier (reduces weight)
-                    all_modifiers.append(AIModifier(
-                        condition=f"NOT = {{ has_trait = {trait_name} }}",
-                        weight_adjustment=-trait.weight
-                    ))
-            
-            # Add opposite trait modifiers (strong negative)
-            for trait_name in character_model.opposite_traits:
-                trait = self.trait_manager.get_trait(trait_name)
-                if trait:
-                    # Add opposite trait modifier (strongly reduces weight)
-                    all_modifiers.append(AIModifier(
-                        condition=f"NOT = {{ has_trait = {trait_name} }}",
-                        weight_adjustment=-trait.weight
-                    ))
-            
-            # Create unified model parameters
-            parameters = AIModelParameters(
-                base_weight=total_base_weight,
-                modifiers=all_modifiers
-            )
+                        )
+                        for mod_data in trait.ai_effects.get('modifiers', [])
+                    )
+                )
+            self._positive_trait_modifiers[trait_name] = modifiers
+        return modifiers
+    
+    def _get_against_trait_modifier(self, trait_name: str) -> Optional[AIModifier]:
+        """
+        Get the modifier a negative or opposite trait adds to a model.
+        
+        Args:
+            trait_name: Name of the negative or opposite trait
             
-            # Create unified AI model
-            unified_model = AIModel(
-                name=model_name,
-                description=character_model.description,
-                parameters=parameters
+        Returns:
+            NOT has_trait modifier reducing the weight by the trait weight,
+            None for unknown traits
+        """
+        if trait_name in self._against_trait_modifiers:
+            return self._against_trait_modifiers[trait_name]
+        
+        trait = self.trait_manager.traits.get(trait_name)
+        modifier = None
+        if trait is not None:
+            modifier = self._make_modifier(
+                condition=sys.intern(f"NOT = {{ has_trait = {trait_name} }}"),
+                weight_adjustment=-trait.weight
             )
+        self._against_trait_modifiers[trait_name] = modifier
+        return modifier
+    
+    def _build_unified_model(
+        self,
+        character_model: CharacterModel,
+        model_traits: Optional[List[str]] = None
+    ) -> AIModel:
+        """
+        Build the unified AIModel for one character model.
+        
+        Args:
+            character_model: Character model to combine with its traits
+            model_traits: Result of _get_model_traits for the model if already known
             
-            self.models[model_name] = unified_model
+        Returns:
+            Unified AIModel instance
+        """
+        # Calculate total base weight
+        total_base_weight = character_model.base_weight
+        
+        # Look the trait lists up once, they are used for interactions and modifiers
+        positive_traits = character_model.traits.get('positive', [])
+        negative_traits = character_model.traits.get('negative', [])
+        opposite_traits = character_model.opposite_traits
+        
+        # Collect all modifiers, starting with the character model's own
+        all_modifiers = list(character_model.modifiers)
+        make_modifier = self._make_modifier
+        append_modifier = all_modifiers.append
+        extend_modifiers = all_modifiers.extend
+        
+        # Collect all traits for interaction analysis
+        if model_traits is None:
+            model_traits = [*positive_traits, *negative_traits, *opposite_traits]
+        
+        # Add trait interaction modifiers
+        interactions = self.detect_trait_interactions(model_traits)
+        for interaction in interactions:
+            if interaction.interaction_type in ["synergy", "antagonism"]:
+                # Simple interaction - just add weight
+                append_modifier(make_modifier(
+                    condition=f"# Trait interaction: {interaction.description}",
+                    weight_adjustment=interaction.weight_modifier
+                ))
+            elif interaction.interaction_type == "conditional" and interaction.conditions:
+                # Conditional interaction - add with conditions
+                condition_str = " ".join(interaction.conditions)
+                append_modifier(make_modifier(
+                    condition=condition_str,
+                    weight_adjustment=interaction.weight_modifier
+                ))
+        
+        # Add trait-based modifiers, each positive trait adds its HAS_TRAIT
+        # modifier and its AI effects modifiers
+        for trait_name in positive_traits:
+            extend_modifiers(self._get_positive_trait_modifiers(trait_name))
+        
+        # Add negative and then opposite trait modifiers in one pass, both are
+        # NOT conditions reducing the weight by the trait weight
+        extend_modifiers(
+            modifier
+            for modifier in map(self._get_against_trait_modifier, chain(negative_traits, opposite_traits))
+            if modifier is not None
+        )
+        
+        # Create unified model parameters
+        parameters = AIModelParameters(
+            base_weight=total_base_weight,
+            modifiers=all_modifiers
+        )
+        
+        # Create unified AI model
+        return AIModel(
+            name=character_model.name,
+            description=character_model.description,
+            parameters=parameters
+        )
         
-        # Cache the models
-        self._unified_models_cache = self.models.copy()
-        print(f"Built {len(self.models)} unified AI models with trait interactions")
     
-    def rebuild_models(self, force: bool = False) -> None:
+    def rebuild_models(self, force: bool = False, affected_traits: Optional[Iterable[str]] = None) -> None:
         """
         Rebuild unified models, optionally forcing a full rebuild.
         
+        Without force, only models invalidated by added trait interactions
+        are rebuilt, plus any models referencing affected_traits.
+        
         Args:
             force: If True, forces a complete rebuild regardless of cache state
+            affected_traits: Traits whose models should be rebuilt (optional)
         """
-        if force or not self._unified_models_cache:
+        if force:
             print("Forcing model rebuild...")
             self._build_unified_models()
-        else:
+            return
+        
+        if self._unified_models_cache is None:
+            print("No cached models, rebuilding all models...")
+            self._build_unified_models()
+            return
+        
+        model_names = set(self._stale_models)
+        if affected_traits is not None:
+            affected_traits = list(affected_traits)
+            self._clear_trait_modifiers(affected_traits)
+            model_names.update(self._get_models_using_traits(affected_traits))
+        
+        if not model_names:
             print("Using cached models (use force=True to rebuild)")
+            return
+        
+        print(f"Rebuilding {len(model_names)} models affected by trait changes...")
+        for model_name in model_names:
+            self._trait_weight_sums.pop(model_name, None)
+            self._validation_cache.pop(model_name, None)
+            unified_model = self._build_unified_model(self.character_models[model_name])
+            self.models[model_name] = unified_model
+            self._unified_models_cache[model_name] = unified_model
+        self._stale_models.clear()
     
     def invalidate_cache(self) -> None:
         """Invalidate the unified models cache, forcing rebuild on next access."""
         self._unified_models_cache = None
+        self._validation_cache.clear()
+        self._trait_weight_sums.clear()
+        self._clear_trait_modifiers()
         print("Model cache invalidated")
     
     def is_cache_valid(self) -> bool:
         """
         Check if the unified models cache is valid.
         
+        The cache is invalid after invalidate_cache() or while models marked
+        stale by add_custom_trait_interaction() wait for rebuild_models().
+        An interaction affecting no loaded model leaves it valid.
+        
         Returns:
             True if cache is valid, False if rebuild is needed
         """
-        return self._unified_models_cache is not None
+        return self._unified_models_cache is not None and not self._stale_models
     
     def get_cache_info(self) -> Dict[str, Any]:
         """
@@ -543,7 +1220,7 @@ class AIModelManager:
             'cached_models': len(self._unified_models_cache) if self._unified_models_cache else 0,
             'active_models': len(self.models),
             'character_models': len(self.character_models),
-            'trait_interactions': len(self.trait_manager.get_trait_interactions())
+            'trait_interactions': self.trait_manager.get_interaction_count()
         }
     
     def get_model(self, model_name: str) -> Optional[AIModel]:
@@ -579,6 +1256,15 @@ class AIModelManager:
         """
         return list(self.models.keys())
     
+    def iter_models(self) -> Iterator[Tuple[str, AIModel]]:
+        """
+        Iterate over all unified models without looking each one up by name.
+        
+        Returns:
+            Iterator of (model name, AIModel) tuples
+        """
+        return iter(self.models.items())
+    
     def list_character_models(self) -> List[str]:
         """
         Get a list of all available character model names.
@@ -588,6 +1274,15 @@ class AIModelManager:
         """
         return list(self.character_models.keys())
     
+    def iter_character_models(self) -> Iterator[Tuple[str, CharacterModel]]:
+        """
+        Iterate over all character models without looking each one up by name.
+        
+        Returns:
+            Iterator of (model name, CharacterModel) tuples
+        """
+        return iter(self.character_models.items())
+    
     def model_exists(self, model_name: str) -> bool:
         """
         Check if a unified model exists.
@@ -628,81 +1323,62 @@ class AIModelManager:
         Returns:
             TraitValidationResult with validation details
         """
-        missing_traits = []
         conflicting_traits = []
         warnings = []
         total_weight = model.base_weight
         
+        # Look the trait lists up once, every check below uses them
+        positive_list = model.traits.get('positive', [])
+        negative_list = model.traits.get('negative', [])
+        opposite_list = model.opposite_traits
+        
         # Collect all traits referenced in the model
-        all_traits: Set[str] = set()
-        for trait_list in model.traits.values():
-            all_traits.update(trait_list)
-        all_traits.update(model.opposite_traits)
+        all_traits = frozenset(chain(*model.traits.values(), opposite_list))
         
         # Check for missing traits
-        for trait_name in all_traits:
-            if not self.trait_manager.trait_exists(trait_name):
-                missing_traits.append(trait_name)
+        available_traits = self.trait_manager.traits
+        missing_traits = [trait_name for trait_name in all_traits if trait_name not in available_traits]
         
         # Check for trait conflicts
-        trait_list = list(all_traits)
-        for i, trait1 in enumerate(trait_list):
-            for trait2 in trait_list[i+1:]:
-                if not self.trait_manager.are_traits_compatible(trait1, trait2):
-                    conflicting_traits.append((trait1, trait2, "opposite traits"))
-        
-        # Check for traits that are both positive and negative
-        positive_traits = set(model.traits.get('positive', []))
-        negative_traits = set(model.traits.get('negative', []))
-        opposite_traits = set(model.opposite_traits)
-        
-        # Find overlaps
-        pos_neg_overlap = positive_traits & negative_traits
-        pos_opp_overlap = positive_traits & opposite_traits
-        neg_opp_overlap = negative_traits & opposite_traits
-        
-        for trait in pos_neg_overlap:
-            conflicting_traits.append((trait, trait, "both positive and negative"))
-        
-        for trait in pos_opp_overlap:
-            conflicting_traits.append((trait, trait, "both positive and opposite"))
-            
-        for trait in neg_opp_overlap:
-            conflicting_traits.append((trait, trait, "both negative and opposite"))
-        
-        # Calculate total trait weight contribution
-        for trait_name in model.traits.get('positive', []):
-            trait_def = self.trait_manager.get_trait(trait_name)
-            if trait_def:
-                total_weight += trait_def.weight
+        conflicting_traits.extend(
+            (trait1, trait2, "opposite traits")
+            for trait1, trait2 in self.trait_manager.find_opposite_trait_pairs(list(all_traits))
+        )
         
-        for trait_name in model.traits.get('negative', []):
-            trait_def = self.trait_manager.get_trait(trait_name)
-            if trait_def:
-                total_weight -= trait_def.weight  # Negative contribution
+        # Check for traits listed in more than one of the trait lists
+        trait_lists: Dict[str, int] = {}
+        for traits, flag in ((positive_list, POSITIVE_TRAIT), (negative_list, NEGATIVE_TRAIT),
+                             (opposite_list, OPPOSITE_TRAIT)):
+            for trait in traits:
+                trait_lists[trait] = trait_lists.get(trait, 0) | flag
+        
+        for trait, flags in trait_lists.items():
+            # More than one bit set
+            if flags & (flags - 1):
+                conflicting_traits.extend(
+                    (trait, trait, reason)
+                    for pair, reason in TRAIT_LIST_CONFLICTS
+                    if flags & pair == pair
+                )
         
-        for trait_name in model.opposite_traits:
-            trait_def = self.trait_manager.get_trait(trait_name)
-            if trait_def:
-                total_weight -= trait_def.weight  # Negative contribution
+        # Calculate total trait weight contribution, negative and opposite
+        # traits count against the model
+        positive_weight, negative_weight, opposite_weight = self._get_trait_weight_sums(model)
+        total_weight += positive_weight - negative_weight - opposite_weight
         
         # Detect trait interactions
-        all_model_traits = []
-        all_model_traits.extend(model.traits.get('positive', []))
-        all_model_traits.extend(model.traits.get('negative', []))
-        all_model_traits.extend(model.opposite_traits)
+        all_model_traits = [*positive_list, *negative_list, *opposite_list]
         
         detected_interactions = self.detect_trait_interactions(all_model_traits)
         
         # Add interaction weight to total
-        interaction_weight = self.calculate_trait_interaction_weight(all_model_traits)
-        total_weight += interaction_weight
+        total_weight += sum(interaction.weight_modifier for interaction in detected_interactions)
         
         # Generate warnings
         if total_weight < 0:
             warnings.append("Total weight is negative - model may not work effectively")
         
-        if len(model.traits.get('positive', [])) == 0:
+        if len(positive_list) == 0:
             warnings.append("Model has no positive traits - consider adding some")
         
         # Check for negative interactions
@@ -722,18 +1398,93 @@ class AIModelManager:
             trait_interactions=detected_interactions
         )
     
+    def _get_trait_weight_sums(self, model: CharacterModel) -> Tuple[int, int, int]:
+        """
+        Get the summed weights of a model's positive, negative and opposite traits.
+        
+        The sums of loaded character models are computed once and kept until
+        the model is rebuilt or the cache is invalidated, other models are
+        summed on every call.
+        
+        Args:
+            model: Character model to sum the trait weights of
+            
+        Returns:
+            Tuple of (positive, negative, opposite) weight sums, unknown traits are skipped
+        """
+        is_loaded = self.character_models.get(model.name) is model
+        if is_loaded:
+            sums = self._trait_weight_sums.get(model.name)
+            if sums is not None:
+                return sums
+        
+        get_trait = self.trait_manager.traits.get
+        
+        def weight_sum(trait_names: List[str]) -> int:
+            return sum(trait.weight for trait in map(get_trait, trait_names) if trait)
+        
+        sums = (
+            weight_sum(model.traits.get('positive', [])),
+            weight_sum(model.traits.get('negative', [])),
+            weight_sum(model.opposite_traits)
+        )
+        if is_loaded:
+            self._trait_weight_sums[model.name] = sums
+        return sums
+    
     def validate_all_models(self) -> Dict[str, TraitValidationResult]:
         """
         Validate all character models and return results.
         
+        Results are cached per model until the trait or model JSON files
+        change on disk, the model is rebuilt, a trait interaction affecting
+        the model is added or the cache is invalidated. Each call returns
+        copies, so callers can change them without affecting later calls.
+        
         Returns:
             Dictionary mapping model names to their validation results
         """
+        signature = self._get_source_signature()
+        if signature != self._validation_signature:
+            self._validation_cache.clear()
+            self._validation_signature = signature
+        
         results = {}
         for model_name, model in self.character_models.items():
-            results[model_name] = self.validate_character_model_traits(model)
+            result = self._validation_cache.get(model_name)
+            if result is None:
+                result = self.validate_character_model_traits(model)
+                self._validation_cache[model_name] = result
+            results[model_name] = self._copy_validation_result(result)
         return results
     
+    def _get_source_signature(self) -> List[List[Tuple[str, int, int]]]:
+        """
+        Get the signature of the trait and model JSON files as they are on disk.
+        
+        Returns:
+            List of the (file name, mtime_ns, size) signatures of the traits
+            directory and the models directory, empty for a missing directory
+        """
+        signatures = []
+        for directory in (self.trait_manager.traits_dir, self.models_file_path.parent):
+            try:
+                signatures.append(_scan_json_files(directory)[1])
+            except FileNotFoundError:
+                signatures.append([])
+        return signatures
+    
+    @staticmethod
+    def _copy_validation_result(result: TraitValidationResult) -> TraitValidationResult:
+        """Copy a validation result along with its lists."""
+        return replace(
+            result,
+            missing_traits=list(result.missing_traits),
+            conflicting_traits=list(result.conflicting_traits),
+            warnings=list(result.warnings),
+            trait_interactions=None if result.trait_interactions is None else list(result.trait_interactions)
+        )
+    
     def get_trait_usage_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about trait usage across all models.
@@ -743,51 +1494,36 @@ class AIModelManager:
         """
         trait_usage = {}
         total_models = len(self.character_models)
-        
-        # Initialize trait usage counters
-        for trait_name in self.trait_manager.list_traits():
+        models = self.character_models.values()
+        
+        # Count trait usage, each list is counted by Counter in one call
+        positive_counts = Counter(chain.from_iterable(model.traits.get('positive', []) for model in models))
+        negative_counts = Counter(chain.from_iterable(model.traits.get('negative', []) for model in models))
+        opposite_counts = Counter(chain.from_iterable(model.opposite_traits for model in models))
+        
+        used_count = 0
+        for trait_name in self.trait_manager.traits:
+            positive_usage = positive_counts[trait_name]
+            negative_usage = negative_counts[trait_name]
+            opposite_usage = opposite_counts[trait_name]
+            total_usage = positive_usage + negative_usage + opposite_usage
+            if total_usage > 0:
+                used_count += 1
             trait_usage[trait_name] = {
-                'positive_usage': 0,
-                'negative_usage': 0,
-                'opposite_usage': 0,
-                'total_usage': 0,
-                'usage_percentage': 0.0
+                'positive_usage': positive_usage,
+                'negative_usage': negative_usage,
+                'opposite_usage': opposite_usage,
+                'total_usage': total_usage,
+                'usage_percentage': total_usage / total_models * 100 if total_models > 0 else 0.0
             }
         
-        # Count trait usage
-        for model in self.character_models.values():
-            for trait_name in model.traits.get('positive', []):
-                if trait_name in trait_usage:
-                    trait_usage[trait_name]['positive_usage'] += 1
-                    trait_usage[trait_name]['total_usage'] += 1
-            
-            for trait_name in model.traits.get('negative', []):
-                if trait_name in trait_usage:
-                    trait_usage[trait_name]['negative_usage'] += 1
-                    trait_usage[trait_name]['total_usage'] += 1
-            
-            for trait_name in model.opposite_traits:
-                if trait_name in trait_usage:
-                    trait_usage[trait_name]['opposite_usage'] += 1
-                    trait_usage[trait_name]['total_usage'] += 1
-        
-        # Calculate percentages
-        for trait_name in trait_usage:
-            if total_models > 0:
-                trait_usage[trait_name]['usage_percentage'] = (
-                    trait_usage[trait_name]['total_usage'] / total_models * 100
-                )
-        
-        # Add summary statistics
-        used_traits = [t for t in trait_usage if trait_usage[t]['total_usage'] > 0]
-        unused_traits = [t for t in trait_usage if trait_usage[t]['total_usage'] == 0]
-        
+        # Add summary statistics, used traits were counted in the loop above
         return {
             'trait_usage': trait_usage,
             'summary': {
                 'total_traits': len(trait_usage),
-                'used_traits': len(used_traits),
-                'unused_traits': len(unused_traits),
-                'usage_rate': len(used_traits) / len(trait_usage) * 100 if trait_usage else 0
+                'used_traits': used_count,
+                'unused_traits': len(trait_usage) - used_count,
+                'usage_rate': used_count / len(trait_usage) * 100 if trait_usage else 0
             }
         } 
\ No newline at end of file
@@ -7,6 +7,7 @@ AI Weight Generator. It can list available mods, show mod details,
 and help configure the tool to work with specific mods.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -55,22 +56,30 @@ def print_mod_details(mod: Dict[str, Any]) -> None:
     if mod['description']:
         print(f"Description: {mod['description']}")
     
-    # Check for common CK3 directories
+    # Check for common CK3 directories, reading the mod directory once
     mod_path = Path(mod['path'])
     common_dirs = ["events", "common", "localization", "gfx", "music"]
+    try:
+        with os.scandir(mod_path) as entries:
+            mod_entries = {entry.name: entry for entry in entries}
+    except OSError:
+        mod_entries = {}
     
     print("\nMod Structure:")
     for dir_name in common_dirs:
-        dir_path = mod_path / dir_name
-        if dir_path.exists():
+        if dir_name in mod_entries:
             print(f"  ✅ {dir_name}/")
         else:
             print(f"  ❌ {dir_name}/ (not found)")
     
     # Check for events files specifically
-    events_dir = mod_path / "events"
-    if events_dir.exists():
-        event_files = list(events_dir.glob("*.txt"))
+    events_entry = mod_entries.get("events")
+    if events_entry is not None and events_entry.is_dir():
+        with os.scandir(events_entry.path) as entries:
+            event_files = [
+                entry for entry in entries
+                if entry.name.endswith(".txt") and not entry.name.startswith(".")
+            ]
         print(f"\nEvent Files: {len(event_files)}")
         for event_file in event_files[:5]:  # Show first 5
             print(f"  - {event_file.name}")
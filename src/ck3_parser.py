@@ -9,18 +9,27 @@ extensible for future CK3 file types.
 The parser supports both local development and CK3 mod folder integration.
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .ai_model_manager import AIModelManager
 from .ck3_trigger_generator import CK3TriggerGenerator, GeneratedTrigger
 
 # Import our custom modules
-from .config_manager import ConfigManager
-from .event_parser import AIBlock, EventParser, ParsedEvent
+from .config_manager import ConfigManager, ProcessingConfig
+from .event_parser import EventParser, ParsedEvent
+
+
+# Parsed event files are cached here between runs, keyed on mtime and size
+PARSE_CACHE_FILE = ".ck3cache.json"
+
+# Runs changing fewer event files than this rewrite them in the current thread
+PARALLEL_APPLY_MIN_FILES = 16
 
 
 class FileType(Enum):
@@ -103,6 +112,9 @@ class CK3Parser:
             print(f"Error loading AI models: {e}")
             return False
         
+        # Unchanged event files are not parsed again
+        self.event_parser.load_parse_cache(Path(PARSE_CACHE_FILE))
+        
         # Determine target path
         self.target_mod_path = self._determine_target_path()
         if self.target_mod_path:
@@ -246,30 +258,55 @@ class CK3Parser:
             )
         
         try:
-            parsed_events = self.event_parser.parse_events_directory(events_dir)
-            
-            # Generate triggers
-            all_ai_blocks = []
-            for event in parsed_events:
-                all_ai_blocks.extend(event.ai_blocks)
-            
-            triggers = {}
-            for block in all_ai_blocks:
-                if self.ai_model_manager and self.trigger_generator:
-                    if self.ai_model_manager.model_exists(block.model_name):
+            # Parse, count and generate triggers in one streaming pass over the files.
+            # Blocks using the same model share one generated trigger, and only
+            # events that will be changed are kept for the apply step.
+            can_generate = bool(self.ai_model_manager and self.trigger_generator)
+            triggers_by_model: Dict[str, Optional[GeneratedTrigger]] = {}
+            events_to_change: List[ParsedEvent] = []
+            files_processed = 0
+            files_with_ai_lib = 0
+            total_ai_blocks = 0
+            successful_triggers = 0
+            for event in self.event_parser.iter_events_directory(events_dir):
+                files_processed += 1
+                files_with_ai_lib += event.has_ai_lib
+                total_ai_blocks += len(event.ai_blocks)
+                if not can_generate:
+                    continue
+                
+                event_triggers = 0
+                for block in event.ai_blocks:
+                    if block.model_name not in triggers_by_model:
+                        trigger = None
                         model = self.ai_model_manager.get_model(block.model_name)
-                        if model:  # Add null check for model
+                        if model:
                             trigger = self.trigger_generator.generate_trigger_from_model(model)
-                            triggers[block] = trigger
+                        triggers_by_model[block.model_name] = trigger
+                    
+                    if triggers_by_model[block.model_name] is not None:
+                        event_triggers += 1
+                
+                if event_triggers:
+                    successful_triggers += event_triggers
+                    events_to_change.append(event)
+            
+            self.event_parser.save_parse_cache()
+            
+            # Only models with a trigger are kept, blocks look theirs up by model name
+            triggers = {
+                model_name: trigger for model_name, trigger in triggers_by_model.items()
+                if trigger is not None
+            }
             
             return ParseResult(
                 file_type=FileType.EVENTS,
-                files_processed=len(parsed_events),
-                files_with_ai_blocks=sum(1 for e in parsed_events if e.has_ai_lib),
-                total_ai_blocks=len(all_ai_blocks),
-                successful_triggers=len(triggers),
+                files_processed=files_processed,
+                files_with_ai_blocks=files_with_ai_lib,
+                total_ai_blocks=total_ai_blocks,
+                successful_triggers=successful_triggers,
                 errors=[],
-                parsed_data={"events": parsed_events, "triggers": triggers}
+                parsed_data={"events": events_to_change, "triggers": triggers}
             )
             
         except Exception as e:
@@ -385,92 +422,240 @@ class CK3Parser:
         events = parsed_data.get("events", [])
         triggers = parsed_data.get("triggers", {})
         
-        for event in events:
-            if not event.ai_blocks:
-                continue
+        # Blocks of the same model share a trigger, so each one is formatted once
+        formatted_triggers: Dict[int, List[bytes]] = {}
+        
+        # Settings that are the same for every file of the run
+        processing = self.config_manager.get_program_config().processing
+        if self.target_mod_path:
+            create_backup = self.config_manager.create_mod_backup
+        else:
+            create_backup = self.config_manager.create_backup
+        
+        # Files whose blocks all use unknown models are left untouched
+        events_to_change = [
+            event for event in events
+            if any(block.model_name in triggers for block in event.ai_blocks)
+        ]
+        
+        def rewrite_event_file(event: ParsedEvent) -> List[str]:
+            """Back up and rewrite one event file, returning its log lines."""
+            messages = []
             
             # Create backup if enabled
-            if self.target_mod_path:
-                backup_path = self.config_manager.create_mod_backup(event.file_path)
-            else:
-                backup_path = self.config_manager.create_backup(event.file_path)
+            backup_path = create_backup(event.file_path)
             
             if backup_path:
-                print(f"    Created backup: {backup_path.name}")
+                messages.append(f"    Created backup: {backup_path.name}")
             
             # Apply triggers
-            self._apply_triggers_to_event_file(event, triggers)
+            applied_count = self._apply_triggers_to_event_file(event, triggers, formatted_triggers, processing)
+            if applied_count:
+                messages.append(f"    Applied {applied_count} triggers to {event.file_path.name}")
+            return messages
+        
+        cpu_count = os.cpu_count() or 1
+        if len(events_to_change) >= PARALLEL_APPLY_MIN_FILES and cpu_count > 1:
+            # Files are independent and the work is mostly I/O, so rewrite them in
+            # threads; log lines are printed here, in file order
+            with ThreadPoolExecutor(max_workers=cpu_count) as executor:
+                for messages in executor.map(rewrite_event_file, events_to_change):
+                    for message in messages:
+                        print(message)
+        else:
+            for event in events_to_change:
+                for message in rewrite_event_file(event):
+                    print(message)
     
-    def _apply_triggers_to_event_file(self, event: ParsedEvent, triggers: Dict[AIBlock, GeneratedTrigger]) -> None:
+    def _apply_triggers_to_event_file(
+        self,
+        event: ParsedEvent,
+        triggers: Dict[str, GeneratedTrigger],
+        formatted_triggers: Optional[Dict[int, List[bytes]]] = None,
+        processing: Optional[ProcessingConfig] = None
+    ) -> int:
         """
         Apply triggers to a single event file.
         
+        Only reads the shared arguments, apart from adding missing entries to
+        formatted_triggers, so files can be rewritten from several threads.
+        
         Args:
             event: Parsed event file
-            triggers: Dictionary mapping AI blocks to triggers
+            triggers: Dictionary mapping model names to triggers
+            formatted_triggers: Encoded, indented trigger lines keyed by trigger
+                id, shared between files of one run (optional)
+            processing: Processing options of the run (optional, read from the
+                configuration if omitted)
+            
+        Returns:
+            Number of triggers applied to the file
         """
-        # Read the original file
-        with open(event.file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-        
-        # Apply triggers in reverse order to maintain line numbers
-        modified_lines = lines.copy()
-        applied_count = 0
-        
-        for block in sorted(event.ai_blocks, key=lambda b: b.start_line, reverse=True):
-            if block in triggers:
-                trigger = triggers[block]
-                
+        if formatted_triggers is None:
+            formatted_triggers = {}
+        if processing is None:
+            processing = self.config_manager.get_program_config().processing
+        
+        # Read the original file as bytes, translating newlines like text mode does
+        with open(event.file_path, 'rb', buffering=1 << 20) as file:
+            data = file.read()
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        # Replacements are collected bottom to top and spliced in at the end,
+        # with the content offsets of each replaced range
+        replacements: List[Tuple[int, int, List[bytes]]] = []
+        replaced_ranges: List[Tuple[int, int]] = []
+        
+        # Read the processing options once for all blocks of the file
+        delete_markers = processing.delete_markers
+        preserve_comments = processing.preserve_comments
+        
+        # Blocks are parsed in file order, so walking them backwards goes bottom to top
+        for block in reversed(event.ai_blocks):
+            trigger = triggers.get(block.model_name)
+            if trigger is not None:
                 # Generate replacement code
                 if self.trigger_generator:
-                    replacement_code = self.trigger_generator.format_trigger_for_replacement(trigger)
+                    trigger_lines = formatted_triggers.get(id(trigger))
+                    if trigger_lines is None:
+                        replacement_code = self.trigger_generator.format_trigger_for_replacement(trigger)
+                        trigger_lines = [
+                            f"\t\t{line}\n".encode('utf-8')
+                            for line in map(str.strip, replacement_code.split('\n')) if line
+                        ]
+                        formatted_triggers[id(trigger)] = trigger_lines
                     
                     # Build replacement content
                     replacement_content = []
                 
                 # Add start marker if NOT deleting markers
-                if not self.config_manager.should_delete_markers() and block.start_marker_line:
-                    replacement_content.append(block.start_marker_line)
+                if not delete_markers and block.start_marker_line:
+                    replacement_content.append(block.start_marker_line.encode('utf-8'))
                 
                 # Add preserved comments if enabled
-                if self.config_manager.should_preserve_comments() and block.preserved_comments:
+                if preserve_comments and block.preserved_comments:
                     for comment in block.preserved_comments:
-                        replacement_content.append(f"\t\t{comment}\n")
+                        replacement_content.append(f"\t\t{comment}\n".encode('utf-8'))
                 
                 # Add generated trigger code
-                replacement_lines = replacement_code.split('\n')
-                for line in replacement_lines:
-                    if line.strip():
-                        replacement_content.append(f"\t\t{line.strip()}\n")
+                replacement_content.extend(trigger_lines)
                 
                 # Add end marker if NOT deleting markers
-                if not self.config_manager.should_delete_markers() and block.end_marker_line:
-                    replacement_content.append(block.end_marker_line)
+                if not delete_markers and block.end_marker_line:
+                    replacement_content.append(block.end_marker_line.encode('utf-8'))
                 
                 # Replace the AI block content
-                if not self.config_manager.should_delete_markers():
+                if not delete_markers:
                     if block.ai_block_start_line and block.ai_block_end_line:
                         start_idx = block.ai_block_start_line - 1
                         end_idx = block.ai_block_end_line
+                        replaced_ranges.append((block.ai_block_start_offset, block.ai_block_end_offset))
                     else:
                         start_idx = block.start_line - 1
                         end_idx = block.end_line
+                        replaced_ranges.append((block.start_offset, block.end_offset))
                 else:
                     start_idx = block.start_line - 1
                     end_idx = block.end_line
+                    replaced_ranges.append((block.start_offset, block.end_offset))
                 
-                # Remove old lines and insert new content
-                del modified_lines[start_idx:end_idx]
-                for i, line in enumerate(replacement_content):
-                    modified_lines.insert(start_idx + i, line)
-                
-                applied_count += 1
+                replacements.append((start_idx, end_idx, replacement_content))
         
         # Write modified file
-        if applied_count > 0:
-            with open(event.file_path, 'w', encoding='utf-8') as file:
-                file.writelines(modified_lines)
-            print(f"    Applied {applied_count} triggers to {event.file_path.name}")
+        if replacements:
+            modified_data = self._splice_byte_ranges(data, replaced_ranges, replacements)
+            if modified_data is None:
+                modified_data = b"".join(self._splice_replacements(data.splitlines(keepends=True), replacements))
+            # Translate newlines back like text mode does, so Windows still gets CRLF
+            if os.linesep != '\n':
+                modified_data = modified_data.replace(b'\n', os.linesep.encode('ascii'))
+            with open(event.file_path, 'wb', buffering=1 << 20) as file:
+                file.write(modified_data)
+        
+        return len(replacements)
+    
+    @staticmethod
+    def _splice_byte_ranges(
+        data: bytes,
+        replaced_ranges: List[Tuple[int, int]],
+        replacements: List[Tuple[int, int, List[bytes]]]
+    ) -> Optional[bytearray]:
+        """
+        Replace ranges of a file with new content using the parsed offsets.
+        
+        The file is copied into one buffer without splitting it into lines.
+        This only works when the offsets are known, which count characters and
+        so are only byte offsets for ASCII content, and when each range lies
+        above the previous one.
+        
+        Args:
+            data: Original file content with translated newlines
+            replaced_ranges: (start offset, end offset) of each replacement
+            replacements: (start index, end index, new lines) tuples in the
+                same order as replaced_ranges
+            
+        Returns:
+            Modified file content, or None if the line based splice is needed
+        """
+        if not data.isascii():
+            return None
+        
+        previous_start = len(data)
+        for start_offset, end_offset in replaced_ranges:
+            if not 0 <= start_offset <= end_offset <= previous_start:
+                return None
+            previous_start = start_offset
+        
+        modified_data = bytearray()
+        view = memoryview(data)
+        cursor = 0
+        for (start_offset, end_offset), (_, _, content) in zip(reversed(replaced_ranges), reversed(replacements)):
+            modified_data += view[cursor:start_offset]
+            modified_data += b"".join(content)
+            cursor = end_offset
+        modified_data += view[cursor:]
+        return modified_data
+    
+    @staticmethod
+    def _splice_replacements(
+        lines: List[bytes],
+        replacements: List[Tuple[int, int, List[bytes]]]
+    ) -> List[bytes]:
+        """
+        Replace line ranges of a file with new content.
+        
+        Replacements are given in the order they would be applied one by one,
+        bottom of the file first, with indices into the original lines. When
+        each range lies above the previous one the file is rebuilt in a single
+        pass, otherwise the ranges are applied one by one as slice assignments.
+        
+        Args:
+            lines: Original lines of the file
+            replacements: (start index, end index, new lines) tuples
+            
+        Returns:
+            Modified lines of the file
+        """
+        line_count = len(lines)
+        in_bounds = all(0 <= start_idx <= end_idx <= line_count for start_idx, end_idx, _ in replacements)
+        descending = all(replacements[i + 1][1] <= replacements[i][0] for i in range(len(replacements) - 1))
+        
+        if in_bounds and descending:
+            modified_lines: List[bytes] = []
+            cursor = 0
+            for start_idx, end_idx, content in reversed(replacements):
+                modified_lines.extend(lines[cursor:start_idx])
+                modified_lines.extend(content)
+                cursor = end_idx
+            modified_lines.extend(lines[cursor:])
+            return modified_lines
+        
+        # Overlapping ranges, keep the result of applying them in order
+        modified_lines = lines.copy()
+        for start_idx, end_idx, content in replacements:
+            modified_lines[start_idx:end_idx] = content
+        return modified_lines
     
     def print_summary(self, summary: ProcessingSummary) -> None:
         """
@@ -26,15 +26,17 @@ class GeneratedTrigger:
 class CK3TriggerGenerator:
     """Generates CK3 trigger code based on unified AI models."""
     
-    def __init__(self, config_manager=None):
+    def __init__(self, config_manager=None, condition_manager: Optional[ConditionManager] = None):
         """
         Initialize the CK3 trigger generator.
         
         Args:
             config_manager: ConfigManager instance (optional)
+            condition_manager: Existing ConditionManager to reuse (optional, a
+                new one is created and loaded from disk if omitted)
         """
         self.config_manager = config_manager
-        self.condition_manager = ConditionManager()
+        self.condition_manager = condition_manager if condition_manager is not None else ConditionManager()
     
     def _generate_trait_condition(self, trait_name: str, is_negative: bool = False) -> str:
         """
@@ -282,7 +284,7 @@ class CK3TriggerGenerator:
         """
         if indent_level is None:
             if self.config_manager:
-                indent_level = self.config_manager.get_indent_level()
+                indent_level = self.config_manager.get_program_config().output.indent_level
             else:
                 indent_level = 2
 
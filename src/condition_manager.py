@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .json_utils import load_json
+
 
 class ConditionType(Enum):
     """Enumeration for condition types."""
@@ -64,8 +66,7 @@ class ConditionManager:
             return
         
         try:
-            with open(self.conditions_file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            data = load_json(self.conditions_file_path)
             
             if 'conditions' in data:
                 for category_name, category_data in data['conditions'].items():
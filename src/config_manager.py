@@ -9,7 +9,10 @@ import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dataclass_utils import add_slots
+from .json_utils import decode_json, load_json, write_json
 
 
 @dataclass
@@ -31,7 +34,8 @@ class ModConfig:
     mod_backup_suffix: str
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class AIMarkers:
     """Configuration for AI markers in event files."""
     library_marker: str
@@ -41,7 +45,8 @@ class AIMarkers:
     comment_pattern: str
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class ProcessingConfig:
     """Configuration for file processing behavior."""
     preserve_comments: bool
@@ -50,7 +55,8 @@ class ProcessingConfig:
     backup_suffix: str
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class OutputConfig:
     """Configuration for output and logging."""
     indent_level: int
@@ -59,7 +65,8 @@ class OutputConfig:
     verbose_logging: bool
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class TargetConfig:
     """Configuration for target mod and events folders."""
     events_directory: str
@@ -68,13 +75,14 @@ class TargetConfig:
     is_parent: bool
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class ProgramConfig:
     """Main program configuration."""
     events_directory: str
     models_directory: str
     models_file: str
-    file_extensions: List[str]
+    file_extensions: Tuple[str, ...]
     ai_markers: AIMarkers
     processing: ProcessingConfig
     output: OutputConfig
@@ -93,33 +101,63 @@ class ConfigManager:
         """
         self.config_file_path = Path(config_file_path)
         self.default_config_path = Path("config.default.json")
-        self.config_data: Dict[str, Any] = {}
-        self.mod_config: Optional[ModConfig] = None
-        self.program_config: Optional[ProgramConfig] = None
+        self._config_data: Optional[Dict[str, Any]] = None
+        self._mod_config: Optional[ModConfig] = None
+        self._program_config: Optional[ProgramConfig] = None
         self.ai_models: Dict[str, Any] = {}
+        self._derived_paths: Dict[str, Path] = {}
         
-        self._load_config()
+        # The file to load is picked now, so a missing configuration still fails
+        # here, but it is only read and parsed on first access
+        self._config_to_load = self._find_config_file()
+    
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """Raw configuration data, loaded on first access."""
+        if self._config_data is None:
+            self._load_config()
+        return self._config_data
+    
+    @property
+    def mod_config(self) -> ModConfig:
+        """Mod configuration, loaded on first access."""
+        return self.get_mod_config()
+    
+    @property
+    def program_config(self) -> ProgramConfig:
+        """Program configuration, loaded on first access."""
+        return self.get_program_config()
+    
+    def _find_config_file(self) -> Path:
+        """
+        Find the configuration file to load.
+        
+        Returns:
+            Path to the user configuration, or to the default configuration
+            if there is no user configuration
+        """
+        # First try to load user config, then fall back to default
+        if self.config_file_path.exists():
+            return self.config_file_path
+        
+        if self.default_config_path.exists():
+            print(f"User config file '{self.config_file_path}' not found.")
+            print(f"Using default configuration from '{self.default_config_path}'")
+            print("To create your own config, copy 'config.default.json' to 'config.json' and modify as needed.")
+            return self.default_config_path
+        
+        raise FileNotFoundError(
+            f"Configuration file not found: {self.config_file_path}\n"
+            f"Default configuration file not found: {self.default_config_path}"
+        )
     
     def _load_config(self) -> None:
         """Load configuration from the JSON file."""
-        # First try to load user config, then fall back to default
-        config_to_load = self.config_file_path
-        
-        if not self.config_file_path.exists():
-            if self.default_config_path.exists():
-                print(f"User config file '{self.config_file_path}' not found.")
-                print(f"Using default configuration from '{self.default_config_path}'")
-                print("To create your own config, copy 'config.default.json' to 'config.json' and modify as needed.")
-                config_to_load = self.default_config_path
-            else:
-                raise FileNotFoundError(
-                    f"Configuration file not found: {self.config_file_path}\n"
-                    f"Default configuration file not found: {self.default_config_path}"
-                )
+        self._derived_paths = {}
+        config_to_load = self._config_to_load
         
         try:
-            with open(config_to_load, 'r', encoding='utf-8') as file:
-                self.config_data = json.load(file)
+            self._config_data = decode_json(config_to_load.read_bytes())
             
             self._parse_mod_config()
             self._parse_program_config()
@@ -131,9 +169,9 @@ class ConfigManager:
     
     def _parse_mod_config(self) -> None:
         """Parse the mod configuration section."""
-        mod_data = self.config_data.get('mod_config', {})
+        mod_data = self._config_data.get('mod_config', {})
         
-        self.mod_config = ModConfig(
+        self._mod_config = ModConfig(
             name=mod_data.get('name', 'CK3 AI Weight Generator'),
             version=mod_data.get('version', '1.0.0'),
             description=mod_data.get(
@@ -160,7 +198,7 @@ class ConfigManager:
     
     def _parse_program_config(self) -> None:
         """Parse the program configuration section."""
-        prog_config = self.config_data.get('program_config', {})
+        prog_config = self._config_data.get('program_config', {})
         
         ai_markers_data = prog_config.get('ai_markers', {})
         ai_markers = AIMarkers(
@@ -199,16 +237,25 @@ class ConfigManager:
             is_parent=target_data.get('is_parent', False)
         )
         
-        self.program_config = ProgramConfig(
+        self._program_config = ProgramConfig(
             events_directory=prog_config.get('events_directory', 'events'),
             models_directory=prog_config.get('models_directory', 'models'),
             models_file=prog_config.get('models_file', 'models/ai_models.json'),
-            file_extensions=prog_config.get('file_extensions', ['.txt']),
+            file_extensions=tuple(prog_config.get('file_extensions', ['.txt'])),
             ai_markers=ai_markers,
             processing=processing,
             output=output,
             target=target
         )
+        
+        # Build the Path objects handed out by the directory getters once
+        self._derived_paths = {
+            'events_directory': Path(self._program_config.events_directory),
+            'models_directory': Path(self._program_config.models_directory),
+            'models_file': Path(self._program_config.models_file),
+            'target_events_directory': Path(target.events_directory),
+            'target_mod_folder': Path(target.mod_folder),
+        }
     
     def get_mod_config(self) -> ModConfig:
         """
@@ -217,9 +264,11 @@ class ConfigManager:
         Returns:
             ModConfig instance
         """
-        if self.mod_config is None:
-            raise RuntimeError("Mod configuration not loaded")
-        return self.mod_config
+        if self._mod_config is None:
+            self._load_config()
+            if self._mod_config is None:
+                raise RuntimeError("Mod configuration not loaded")
+        return self._mod_config
     
     def get_program_config(self) -> ProgramConfig:
         """
@@ -228,9 +277,24 @@ class ConfigManager:
         Returns:
             ProgramConfig instance
         """
-        if self.program_config is None:
-            raise RuntimeError("Program configuration not loaded")
-        return self.program_config
+        if self._program_config is None:
+            self._load_config()
+            if self._program_config is None:
+                raise RuntimeError("Program configuration not loaded")
+        return self._program_config
+    
+    def _get_derived_path(self, name: str) -> Path:
+        """
+        Get a cached Path derived from the program configuration.
+        
+        Args:
+            name: Key of the derived path
+            
+        Returns:
+            Cached Path instance
+        """
+        self.get_program_config()
+        return self._derived_paths[name]
     
     def get_events_directory(self) -> Path:
         """
@@ -239,8 +303,7 @@ class ConfigManager:
         Returns:
             Path to the events directory
         """
-        config = self.get_program_config()
-        return Path(config.events_directory)
+        return self._get_derived_path('events_directory')
     
     def get_models_directory(self) -> Path:
         """
@@ -249,8 +312,7 @@ class ConfigManager:
         Returns:
             Path to the models directory
         """
-        config = self.get_program_config()
-        return Path(config.models_directory)
+        return self._get_derived_path('models_directory')
     
     def get_models_file(self) -> Path:
         """
@@ -259,8 +321,7 @@ class ConfigManager:
         Returns:
             Path to the models file
         """
-        config = self.get_program_config()
-        return Path(config.models_file)
+        return self._get_derived_path('models_file')
     
     def should_preserve_comments(self) -> bool:
         """
@@ -375,7 +436,7 @@ class ConfigManager:
             List of file extensions
         """
         config = self.get_program_config()
-        return config.file_extensions
+        return list(config.file_extensions)
     
     def get_target_events_directory(self) -> Path:
         """
@@ -384,8 +445,7 @@ class ConfigManager:
         Returns:
             Path to the target events directory
         """
-        config = self.get_program_config()
-        return Path(config.target.events_directory)
+        return self._get_derived_path('target_events_directory')
     
     def get_target_mod_folder(self) -> Path:
         """
@@ -394,8 +454,7 @@ class ConfigManager:
         Returns:
             Path to the target mod folder
         """
-        config = self.get_program_config()
-        return Path(config.target.mod_folder)
+        return self._get_derived_path('target_mod_folder')
     
     def should_use_mod_folder(self) -> bool:
         """
@@ -779,8 +838,7 @@ class ConfigManager:
         
         try:
             # Read current config
-            with open(self.config_file_path, 'r', encoding='utf-8') as file:
-                config = json.load(file)
+            config = load_json(self.config_file_path)
             
             # Update mod_config section
             if 'mod_config' not in config:
@@ -800,10 +858,10 @@ class ConfigManager:
             mod_config['mod_folder_name'] = mod_path.name
             
             # Write updated config
-            with open(self.config_file_path, 'w', encoding='utf-8') as file:
-                json.dump(config, file, indent=2, ensure_ascii=False)
+            write_json(self.config_file_path, config)
             
-            # Reload configuration
+            # Reload configuration from the updated user config
+            self._config_to_load = self.config_file_path
             self._load_config()
             
             return True
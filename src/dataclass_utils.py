@@ -0,0 +1,50 @@
+"""
+Dataclass Utilities for CK3 AI Weight Generator
+
+This module contains helpers for dataclasses that are shared between the
+parser, configuration and AI model modules.
+"""
+
+from dataclasses import fields
+
+
+def _slots_getstate(self) -> tuple:
+    """Return the field values of a slotted dataclass for pickling."""
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _slots_setstate(self, state: tuple) -> None:
+    """Restore the field values of a slotted dataclass after unpickling."""
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def add_slots(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Equivalent of ``dataclass(slots=True)`` for Python versions before 3.10.
+    Field defaults live on the generated ``__init__``, so the class attributes
+    that would conflict with the slots can be dropped. Pickling support is
+    added explicitly because frozen instances cannot be restored through
+    regular attribute assignment.
+    
+    Args:
+        cls: Dataclass to rebuild
+        
+    Returns:
+        New class with the same dataclass behavior and no instance ``__dict__``
+    """
+    field_names = tuple(field.name for field in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = field_names
+    cls_dict['__getstate__'] = _slots_getstate
+    cls_dict['__setstate__'] = _slots_setstate
+    
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
@@ -5,11 +5,105 @@ This module contains classes for parsing CK3 event files and extracting
 AI model references and parameters.
 """
 
+import mmap
+import os
 import re
+import sys
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from .dataclass_utils import add_slots
+from .json_utils import load_json, write_json
+
+
+# Directories with fewer event files than this are parsed in the current process
+PARALLEL_PARSE_MIN_FILES = 16
+
+# Parser used by worker processes, set once per worker by _init_parse_worker
+_worker_parser = None
+
+# Bump when the cached ParsedEvent layout changes so old cache files are ignored
+PARSE_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def _compile_marker_patterns(
+    library_marker: str,
+    start_marker: str,
+    end_marker: str,
+    model_pattern: str,
+    comment_pattern: str
+) -> Tuple[Pattern, ...]:
+    """
+    Compile the parser patterns for configured AI markers.
+    
+    Args:
+        library_marker: Literal AI-MODEL-LIB marker
+        start_marker: Literal AI-START marker
+        end_marker: Literal AI-END marker
+        model_pattern: Regex extracting the model name
+        comment_pattern: Regex matching comment lines
+        
+    Returns:
+        Tuple of (library, start, end, model, comment, content start,
+        content end) patterns
+    """
+    start_pattern = re.compile(re.escape(start_marker), re.IGNORECASE)
+    end_pattern = re.compile(re.escape(end_marker), re.IGNORECASE)
+    
+    return (
+        re.compile(re.escape(library_marker), re.IGNORECASE),
+        start_pattern,
+        end_pattern,
+        re.compile(model_pattern, re.IGNORECASE),
+        re.compile(comment_pattern, re.IGNORECASE),
+        # Literal markers cannot span lines, so they also work on the whole content
+        start_pattern,
+        end_pattern
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_default_patterns() -> Tuple[Pattern, ...]:
+    """
+    Compile the parser patterns used without a configuration.
+    
+    Returns:
+        Tuple of (library, start, end, model, comment, content start,
+        content end) patterns
+    """
+    return (
+        re.compile(r'#\s*AI-MODEL-LIB', re.IGNORECASE),
+        re.compile(r'#\s*AI-START', re.IGNORECASE),
+        re.compile(r'#\s*AI-END', re.IGNORECASE),
+        re.compile(r'using:\s*\{([^}]+)\}', re.IGNORECASE),
+        re.compile(r'#\s*(.+)', re.IGNORECASE),
+        # Same markers as above, but whitespace must not cross a line break
+        # because these patterns run over the whole file content
+        re.compile(r'#[^\S\n]*AI-START', re.IGNORECASE),
+        re.compile(r'#[^\S\n]*AI-END', re.IGNORECASE)
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_library_marker_bytes(library_marker: str) -> Pattern:
+    """
+    Compile the pattern searching raw file bytes for an ASCII library marker.
+    
+    Args:
+        library_marker: Literal AI-MODEL-LIB marker, ASCII only
+        
+    Returns:
+        Compiled bytes pattern
+    """
+    return re.compile(re.escape(library_marker.encode('ascii')), re.IGNORECASE)
 
 
 class ParseState(Enum):
@@ -19,6 +113,7 @@ class ParseState(Enum):
     COLLECTING_PARAMS = "collecting_params"
 
 
+@add_slots
 @dataclass(frozen=True)
 class AIBlock:
     """Represents an AI block found in an event file."""
@@ -27,22 +122,54 @@ class AIBlock:
     model_name: str
     content: str
     file_path: Path
-    preserved_comments: Optional[tuple] = None
-    original_lines: Optional[tuple] = None
+    preserved_comments: Tuple[str, ...] = ()
+    original_lines: Tuple[int, ...] = ()
     start_marker_line: Optional[str] = None
     end_marker_line: Optional[str] = None
     ai_block_start_line: Optional[int] = None
     ai_block_end_line: Optional[int] = None
+    # Offsets in the newline-translated file content where start_line and
+    # ai_block_start_line begin and where end_line and ai_block_end_line end,
+    # -1 if unknown
+    start_offset: int = -1
+    end_offset: int = -1
+    ai_block_start_offset: int = -1
+    ai_block_end_offset: int = -1
 
 
+@add_slots
 @dataclass
 class ParsedEvent:
-    """Represents a parsed event file with AI blocks."""
+    """Represents a parsed event file with AI blocks, in the order they appear in the file."""
     file_path: Path
     has_ai_lib: bool
     ai_blocks: List[AIBlock]
 
 
+def _init_parse_worker(parser: "EventParser") -> None:
+    """
+    Store the parser used by a worker process.
+    
+    Args:
+        parser: EventParser instance to use for parsing in this worker
+    """
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_one(file_path: Path) -> Tuple[Path, Optional["ParsedEvent"], str]:
+    """
+    Parse a single event file in a worker process.
+    
+    Args:
+        file_path: Path to the event file to parse
+        
+    Returns:
+        Tuple of (file path, ParsedEvent or None, error message)
+    """
+    return _worker_parser._try_parse_event_file(file_path)
+
+
 class EventParser:
     """Parser for CK3 event files to extract AI model references."""
     
@@ -55,19 +182,175 @@ class EventParser:
         """
         self.config_manager = config_manager
         
-        if config_manager:
-            markers = config_manager.get_program_config().ai_markers
-            self.ai_lib_pattern = re.compile(re.escape(markers.library_marker), re.IGNORECASE)
-            self.ai_start_pattern = re.compile(re.escape(markers.start_marker), re.IGNORECASE)
-            self.ai_end_pattern = re.compile(re.escape(markers.end_marker), re.IGNORECASE)
-            self.model_pattern = re.compile(markers.model_pattern, re.IGNORECASE)
-            self.comment_pattern = re.compile(markers.comment_pattern, re.IGNORECASE)
+        program_config = config_manager.get_program_config() if config_manager else None
+        
+        if program_config:
+            markers = program_config.ai_markers
+            patterns = _compile_marker_patterns(
+                markers.library_marker,
+                markers.start_marker,
+                markers.end_marker,
+                markers.model_pattern,
+                markers.comment_pattern
+            )
+        else:
+            patterns = _compile_default_patterns()
+        
+        (
+            self.ai_lib_pattern,
+            self.ai_start_pattern,
+            self.ai_end_pattern,
+            self.model_pattern,
+            self.comment_pattern,
+            self._content_start_pattern,
+            self._content_end_pattern
+        ) = patterns
+        
+        # ASCII library markers can be searched for in the raw file bytes
+        if program_config and markers.library_marker and markers.library_marker.isascii():
+            self._lib_marker_bytes = _compile_library_marker_bytes(markers.library_marker)
         else:
-            self.ai_lib_pattern = re.compile(r'#\s*AI-MODEL-LIB', re.IGNORECASE)
-            self.ai_start_pattern = re.compile(r'#\s*AI-START', re.IGNORECASE)
-            self.ai_end_pattern = re.compile(r'#\s*AI-END', re.IGNORECASE)
-            self.model_pattern = re.compile(r'using:\s*\{([^}]+)\}', re.IGNORECASE)
-            self.comment_pattern = re.compile(r'#\s*(.+)', re.IGNORECASE)
+            self._lib_marker_bytes = None
+        
+        # Only a handful of distinct model names exist, so blocks share them
+        self._model_names: Dict[str, str] = {}
+        
+        # Comments are only collected when they will be written back
+        self._preserve_comments = program_config.processing.preserve_comments if program_config else True
+        
+        # Cached results only apply to a parser with the same markers and options
+        self._cache_signature = [pattern.pattern for pattern in patterns[:5]] + [self._preserve_comments]
+        self._cache_file: Optional[Path] = None
+        self._parse_cache: Optional[Dict[str, Any]] = None
+        self._parse_cache_dirty = False
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the parse cache behind when the parser is sent to worker processes."""
+        state = self.__dict__.copy()
+        state['_parse_cache'] = None
+        return state
+    
+    def load_parse_cache(self, cache_file: Path) -> None:
+        """
+        Enable the on-disk parse cache and load previous results from it.
+        
+        Files whose modification time and size match the cached entry are
+        not parsed again by parse_events_directory.
+        
+        Args:
+            cache_file: Path to the JSON cache file, it need not exist yet
+        """
+        self._cache_file = cache_file
+        self._parse_cache = {}
+        self._parse_cache_dirty = False
+        
+        if not cache_file.exists():
+            return
+        
+        try:
+            data = load_json(cache_file)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable parse cache {cache_file}: {e}")
+            return
+        
+        if (
+            isinstance(data, dict)
+            and data.get('version') == PARSE_CACHE_VERSION
+            and data.get('signature') == self._cache_signature
+            and isinstance(data.get('files'), dict)
+        ):
+            self._parse_cache = data['files']
+    
+    def save_parse_cache(self) -> None:
+        """Write the parse cache back to disk if it is enabled and has new entries."""
+        if self._cache_file is None or self._parse_cache is None or not self._parse_cache_dirty:
+            return
+        
+        data = {
+            'version': PARSE_CACHE_VERSION,
+            'signature': self._cache_signature,
+            'files': self._parse_cache
+        }
+        try:
+            write_json(self._cache_file, data, indent=False)
+        except OSError as e:
+            print(f"Warning: Could not write parse cache {self._cache_file}: {e}")
+            return
+        self._parse_cache_dirty = False
+    
+    def _get_cached_event(self, file_path: Path, stamp: List[int]) -> Optional[ParsedEvent]:
+        """
+        Rebuild a ParsedEvent from the parse cache.
+        
+        Args:
+            file_path: Path to the event file
+            stamp: Current [mtime_ns, size] of the file
+            
+        Returns:
+            Cached ParsedEvent, or None if the file is not cached or has changed
+        """
+        entry = self._parse_cache.get(str(file_path))
+        if not entry or entry.get('stamp') != stamp:
+            return None
+        
+        try:
+            ai_blocks = [
+                AIBlock(
+                    start_line=block['start_line'],
+                    end_line=block['end_line'],
+                    model_name=self._intern_model_name(block['model_name']),
+                    content=block['content'],
+                    file_path=file_path,
+                    preserved_comments=tuple(block['preserved_comments']),
+                    original_lines=tuple(block['original_lines']),
+                    start_marker_line=block['start_marker_line'],
+                    end_marker_line=block['end_marker_line'],
+                    ai_block_start_line=block['ai_block_start_line'],
+                    ai_block_end_line=block['ai_block_end_line'],
+                    start_offset=block['start_offset'],
+                    end_offset=block['end_offset'],
+                    ai_block_start_offset=block['ai_block_start_offset'],
+                    ai_block_end_offset=block['ai_block_end_offset']
+                )
+                for block in entry['ai_blocks']
+            ]
+        except (KeyError, TypeError):
+            return None
+        
+        return ParsedEvent(file_path=file_path, has_ai_lib=entry['has_ai_lib'], ai_blocks=ai_blocks)
+    
+    def _cache_event(self, parsed_event: ParsedEvent, stamp: List[int]) -> None:
+        """
+        Store a parsed event in the parse cache.
+        
+        Args:
+            parsed_event: Parsing result to store
+            stamp: [mtime_ns, size] of the file when it was parsed
+        """
+        self._parse_cache[str(parsed_event.file_path)] = {
+            'stamp': stamp,
+            'has_ai_lib': parsed_event.has_ai_lib,
+            'ai_blocks': [
+                {
+                    'start_line': block.start_line,
+                    'end_line': block.end_line,
+                    'model_name': block.model_name,
+                    'content': block.content,
+                    'preserved_comments': list(block.preserved_comments),
+                    'original_lines': list(block.original_lines),
+                    'start_marker_line': block.start_marker_line,
+                    'end_marker_line': block.end_marker_line,
+                    'ai_block_start_line': block.ai_block_start_line,
+                    'ai_block_end_line': block.ai_block_end_line,
+                    'start_offset': block.start_offset,
+                    'end_offset': block.end_offset,
+                    'ai_block_start_offset': block.ai_block_start_offset,
+                    'ai_block_end_offset': block.ai_block_end_offset
+                }
+                for block in parsed_event.ai_blocks
+            ]
+        }
+        self._parse_cache_dirty = True
     
     def parse_event_file(self, file_path: Path) -> ParsedEvent:
         """
@@ -82,19 +365,51 @@ class EventParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Event file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            lines = content.split('\n')
+        content = self._read_ai_lib_content(file_path)
+        
+        # Only files marked with AI-MODEL-LIB use AI models, skip the rest
+        if content is None:
+            return ParsedEvent(file_path=file_path, has_ai_lib=False, ai_blocks=[])
         
-        has_ai_lib = self._check_ai_lib_presence(content)
-        ai_blocks = self._extract_ai_blocks(file_path, lines)
+        ai_blocks = self._extract_ai_blocks(file_path, content)
         
         return ParsedEvent(
             file_path=file_path,
-            has_ai_lib=has_ai_lib,
+            has_ai_lib=True,
             ai_blocks=ai_blocks
         )
     
+    def _read_ai_lib_content(self, file_path: Path) -> Optional[str]:
+        """
+        Read an event file if it contains the AI-MODEL-LIB marker.
+        
+        With an ASCII library marker the raw file is memory-mapped and searched
+        as bytes, so files without the marker are never decoded.
+        
+        Args:
+            file_path: Path to the event file
+            
+        Returns:
+            File content as string, or None if the marker is not present
+        """
+        if self._lib_marker_bytes is None:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+            return content if self._check_ai_lib_presence(content) else None
+        
+        with open(file_path, 'rb') as file:
+            # Empty files cannot be memory-mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                return None
+            
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if not self._lib_marker_bytes.search(mapped):
+                    return None
+                data = mapped[:]
+        
+        # Translate newlines the same way as reading in text mode
+        return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    
     def _check_ai_lib_presence(self, content: str) -> bool:
         """
         Check if the file contains AI-MODEL-LIB marker.
@@ -107,13 +422,60 @@ class EventParser:
         """
         return bool(self.ai_lib_pattern.search(content))
     
-    def _extract_ai_blocks(self, file_path: Path, lines: List[str]) -> List[AIBlock]:
+    def _find_marker_offsets(self, content: str) -> List[Tuple[int, bool]]:
+        """
+        Find the offsets of all AI start and end markers.
+        
+        Args:
+            content: File content as string
+            
+        Returns:
+            List of (offset, is start marker) tuples sorted by offset
+        """
+        hits = [(match.start(), True) for match in self._content_start_pattern.finditer(content)]
+        hits.extend((match.start(), False) for match in self._content_end_pattern.finditer(content))
+        hits.sort()
+        return hits
+    
+    def _find_marker_lines(self, content: str) -> List[Tuple[int, int, bool, bool]]:
         """
-        Extract AI blocks from the file lines.
+        Find all lines containing AI start or end markers.
+        
+        Args:
+            content: File content as string
+            
+        Returns:
+            List of (line number, line start offset, has start marker,
+            has end marker) tuples in file order
+        """
+        marker_lines: List[Tuple[int, int, bool, bool]] = []
+        line_num = 1
+        last_offset = 0
+        
+        for offset, is_start in self._find_marker_offsets(content):
+            line_num += content.count('\n', last_offset, offset)
+            last_offset = offset
+            
+            if marker_lines and marker_lines[-1][0] == line_num:
+                _, line_start, has_start, has_end = marker_lines[-1]
+                marker_lines[-1] = (line_num, line_start, has_start or is_start, has_end or not is_start)
+            else:
+                line_start = content.rfind('\n', 0, offset) + 1
+                marker_lines.append((line_num, line_start, is_start, not is_start))
+        
+        return marker_lines
+    
+    def _extract_ai_blocks(self, file_path: Path, content: str) -> List[AIBlock]:
+        """
+        Extract AI blocks from the file content.
+        
+        Only lines containing markers are visited. Everything else is handled
+        with offsets into the content, so the file is never split into lines
+        and per-line work is limited to the content of confirmed blocks.
         
         Args:
             file_path: Path to the event file
-            lines: List of file lines
+            content: File content as string
             
         Returns:
             List of AIBlock instances
@@ -121,142 +483,228 @@ class EventParser:
         ai_blocks = []
         state = ParseState.SEARCHING
         current_block_start = -1
+        current_block_start_offset = 0
+        current_block_end_offset = 0
         current_model_name = ""
-        current_content: List[str] = []
-        preserved_comments: List[str] = []
-        original_lines: List[int] = []
+        nested_start_lines: List[int] = []
         ai_chance_start = -1
+        ai_chance_start_offset = -1
         start_marker_line = ""
-        end_marker_line = ""
-        ai_block_start_line = -1
-        ai_block_end_line = -1
+        search_offset = 0
+        brace_index = None
         
-        for line_num, line in enumerate(lines, 1):
-            line_stripped = line.strip()
+        for line_num, line_start, has_start, has_end in self._find_marker_lines(content):
+            line_end = content.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(content)
+            line = content[line_start:line_end]
             
             if state == ParseState.SEARCHING:
-                # Look for ai_chance = { line
-                if "ai_chance = {" in line_stripped:
-                    ai_chance_start = line_num
+                if not has_start:
+                    continue
                 
-                if self.ai_start_pattern.search(line):
-                    state = ParseState.IN_AI_BLOCK
-                    current_block_start = line_num
-                    current_content = []
-                    preserved_comments = []
-                    original_lines = []
-                    start_marker_line = line
-                    ai_block_start_line = line_num + 1  # Content starts after the start marker
-                    
-                    # Try to extract model name from the same line or next few lines
-                    model_match = self.model_pattern.search(line)
+                state = ParseState.IN_AI_BLOCK
+                current_block_start = line_num
+                current_block_start_offset = line_start
+                current_block_end_offset = line_end
+                nested_start_lines = []
+                start_marker_line = line
+                
+                # Look for the last ai_chance = { line since the previous block
+                ai_chance_offset = content.rfind("ai_chance = {", search_offset, line_end)
+                if ai_chance_offset >= 0:
+                    ai_chance_start = line_num - content.count('\n', ai_chance_offset, line_start)
+                    ai_chance_start_offset = content.rfind('\n', 0, ai_chance_offset) + 1
+                else:
+                    ai_chance_start = -1
+                    ai_chance_start_offset = -1
+                
+                # Try to extract model name from the same line or next few lines
+                model_match = self.model_pattern.search(line)
+                next_line_start = line_end + 1
+                for _ in range(4):
                     if model_match:
-                        current_model_name = model_match.group(1).strip()
-                    else:
-                        # Look ahead for model name
-                        current_model_name = self._find_model_name_ahead(lines, line_num)
-            
-            elif state == ParseState.IN_AI_BLOCK:
-                # Check if this is the end marker
-                if self.ai_end_pattern.search(line):
-                    # End of AI block found
-                    end_marker_line = line
-                    ai_block_end_line = line_num - 1  # Content ends before the end marker
-                    if current_model_name:
-                        # Find the closing brace of the ai_chance block
-                        ai_chance_end = self._find_ai_chance_end(lines, line_num)
-                        
-                        ai_block = AIBlock(
-                            start_line=ai_chance_start if ai_chance_start > 0 else current_block_start,
-                            end_line=ai_chance_end if ai_chance_end > 0 else line_num,
-                            model_name=current_model_name,
-                            content='\n'.join(current_content),
-                            file_path=file_path,
-                            preserved_comments=tuple(preserved_comments) if preserved_comments else None,
-                            original_lines=tuple(original_lines) if original_lines else None,
-                            start_marker_line=start_marker_line,
-                            end_marker_line=end_marker_line,
-                            ai_block_start_line=ai_block_start_line,
-                            ai_block_end_line=ai_block_end_line
-                        )
-                        ai_blocks.append(ai_block)
+                        break
                     
-                    # Reset for next block
-                    state = ParseState.SEARCHING
-                    current_block_start = -1
-                    current_model_name = ""
-                    current_content = []
-                    preserved_comments = []
-                    original_lines = []
-                    ai_chance_start = -1
-                    start_marker_line = ""
-                    end_marker_line = ""
-                    ai_block_start_line = -1
-                    ai_block_end_line = -1
+                    # The last line of the file is not searched
+                    next_line_end = content.find('\n', next_line_start)
+                    if next_line_end == -1:
+                        break
+                    
+                    model_match = self.model_pattern.search(content[next_line_start:next_line_end])
+                    next_line_start = next_line_end + 1
+                
+                if model_match:
+                    current_model_name = self._intern_model_name(model_match.group(1).strip())
                 else:
-                    # This is content between the markers
-                    current_content.append(line)
-                    original_lines.append(line_num)
+                    current_model_name = ""
+            
+            elif not has_end:
+                # A start marker inside a block is kept as regular content
+                nested_start_lines.append(line_num)
+            
+            else:
+                # End of AI block found
+                if current_model_name:
+                    # Find the closing brace of the ai_chance block
+                    if brace_index is None:
+                        brace_index = self._build_brace_index(content)
+                    ai_chance_end, ai_chance_end_offset = self._find_ai_chance_end(
+                        content, brace_index, line_num, line_start
+                    )
+                    original_lines = range(current_block_start + 1, line_num)
+                    
+                    if original_lines:
+                        block_content = content[current_block_end_offset + 1:line_start - 1]
+                    else:
+                        block_content = ""
+                    
+                    # Keep comment lines (but not markers) from the block content
+                    if self._preserve_comments and original_lines:
+                        preserved_comments = [
+                            content_line.strip()
+                            for content_line_num, content_line in zip(original_lines, block_content.split('\n'))
+                            if content_line_num not in nested_start_lines
+                            and self.comment_pattern.search(content_line)
+                        ]
+                    else:
+                        preserved_comments = []
+                    
+                    if ai_chance_start > 0:
+                        start_line, start_offset = ai_chance_start, ai_chance_start_offset
+                    else:
+                        start_line, start_offset = current_block_start, current_block_start_offset
+                    if ai_chance_end > 0:
+                        end_line = ai_chance_end
+                        end_offset = content.find('\n', ai_chance_end_offset) + 1
+                    else:
+                        end_line = line_num
+                        end_offset = min(line_end + 1, len(content))
                     
-                    # Check if this is a comment line (but not a marker)
-                    if (
-                        self.comment_pattern.search(line)
-                        and not self.ai_start_pattern.search(line)
-                        and not self.ai_end_pattern.search(line)
-                    ):
-                        preserved_comments.append(line.strip())
+                    ai_block = AIBlock(
+                        start_line=start_line,
+                        end_line=end_line,
+                        model_name=current_model_name,
+                        content=block_content,
+                        file_path=file_path,
+                        preserved_comments=tuple(preserved_comments),
+                        original_lines=tuple(original_lines),
+                        start_marker_line=start_marker_line,
+                        end_marker_line=line,
+                        ai_block_start_line=current_block_start + 1,  # Content starts after the start marker
+                        ai_block_end_line=line_num - 1,  # Content ends before the end marker
+                        start_offset=start_offset,
+                        end_offset=end_offset,
+                        ai_block_start_offset=min(current_block_end_offset + 1, len(content)),
+                        ai_block_end_offset=line_start
+                    )
+                    ai_blocks.append(ai_block)
+                
+                # Reset for next block
+                state = ParseState.SEARCHING
+                current_model_name = ""
+                search_offset = line_end
         
         return ai_blocks
     
-    def _find_model_name_ahead(self, lines: List[str], start_line: int) -> str:
+    def _intern_model_name(self, model_name: str) -> str:
         """
-        Look ahead in lines to find model name after AI-START.
+        Return the shared string instance for a model name.
         
         Args:
-            lines: List of file lines
-            start_line: Starting line number to search from
+            model_name: Model name as extracted from the file
             
         Returns:
-            Model name if found, empty string otherwise
+            Interned model name
+        """
+        interned = self._model_names.get(model_name)
+        if interned is None:
+            interned = self._model_names[model_name] = sys.intern(model_name)
+        return interned
+    
+    def _build_brace_index(self, content: str) -> Tuple[List[int], List[int], Dict[int, List[int]]]:
         """
-        # Look ahead up to 5 lines
-        for i in range(start_line, min(start_line + 5, len(lines))):
-            line = lines[i - 1]  # Convert to 0-based index
-            model_match = self.model_pattern.search(line)
-            if model_match:
-                return model_match.group(1).strip()
+        Index all closing braces in the file content.
         
-        return ""
+        The content is split on closing braces and only the opening braces of
+        each piece are counted, which keeps the per-brace work in C.
+        
+        Args:
+            content: File content as string
+            
+        Returns:
+            Tuple of (closing brace offsets, number of opening braces before
+            each closing brace, closing brace offsets grouped by the depth
+            after them)
+        """
+        closing_offsets: List[int] = []
+        opening_counts: List[int] = []
+        closing_by_depth: Dict[int, List[int]] = {}
+        offset = -1
+        openings = 0
+        
+        pieces = content.split('}')
+        for closings, piece in enumerate(pieces[:-1]):
+            openings += piece.count('{')
+            offset += len(piece) + 1
+            closing_offsets.append(offset)
+            opening_counts.append(openings)
+            
+            depth = openings - closings - 1
+            offsets_at_depth = closing_by_depth.get(depth)
+            if offsets_at_depth is None:
+                closing_by_depth[depth] = [offset]
+            else:
+                offsets_at_depth.append(offset)
+        
+        return closing_offsets, opening_counts, closing_by_depth
     
-    def _find_ai_chance_end(self, lines: List[str], start_line: int) -> int:
+    def _find_ai_chance_end(
+        self,
+        content: str,
+        brace_index: Tuple[List[int], List[int], Dict[int, List[int]]],
+        start_line: int,
+        start_offset: int
+    ) -> Tuple[int, int]:
         """
         Find the closing brace of the ai_chance block.
         
+        This is the first closing brace after start_offset that brings the
+        brace depth back to the depth at start_offset after an opening brace.
+        
         Args:
-            lines: List of file lines
+            content: File content as string
+            brace_index: Brace index from _build_brace_index
             start_line: Starting line number to search from
+            start_offset: Offset of the start of that line in content
             
         Returns:
-            Line number of the closing brace, or -1 if not found
+            Tuple of (line number, offset) of the closing brace, or (-1, -1)
+            if not found
         """
-        brace_count = 0
-        found_opening = False
+        closing_offsets, opening_counts, closing_by_depth = brace_index
         
-        for i in range(start_line, len(lines)):
-            line = lines[i - 1]  # Convert to 0-based index
-            line_stripped = line.strip()
-            
-            # Count opening and closing braces
-            for char in line_stripped:
-                if char == '{':
-                    brace_count += 1
-                    found_opening = True
-                elif char == '}':
-                    brace_count -= 1
-                    if found_opening and brace_count == 0:
-                        return i
-        
-        return -1
+        # Brace depth at start_offset, counting from the previous closing brace
+        closings = bisect_left(closing_offsets, start_offset)
+        if closings:
+            openings = opening_counts[closings - 1] + content.count('{', closing_offsets[closings - 1], start_offset)
+        else:
+            openings = content.count('{', 0, start_offset)
+        
+        candidates = closing_by_depth.get(openings - closings)
+        if not candidates:
+            return -1, -1
+        
+        position = bisect_left(candidates, start_offset)
+        if position == len(candidates):
+            return -1, -1
+        
+        # The last line of the file is never treated as the closing line
+        closing_offset = candidates[position]
+        if closing_offset > content.rfind('\n'):
+            return -1, -1
+        
+        return start_line + content.count('\n', start_offset, closing_offset), closing_offset
     
     def parse_events_directory(self, events_dir: Path) -> List[ParsedEvent]:
         """
@@ -268,27 +716,115 @@ class EventParser:
         Returns:
             List of ParsedEvent instances
         """
+        return list(self.iter_events_directory(events_dir))
+    
+    def iter_events_directory(self, events_dir: Path) -> Iterator[ParsedEvent]:
+        """
+        Parse all event files in a directory, yielding them one at a time.
+        
+        Events come in the same order as from parse_events_directory, each as
+        soon as it is parsed, so callers that only keep some of them do not
+        hold every parsed file in memory.
+        
+        Args:
+            events_dir: Path to the events directory
+            
+        Yields:
+            ParsedEvent instances
+        """
         if not events_dir.exists() or not events_dir.is_dir():
             raise FileNotFoundError(f"Events directory not found: {events_dir}")
         
         # Get file extensions from config if available
         if self.config_manager:
-            extensions = self.config_manager.get_file_extensions()
+            extensions = self.config_manager.get_program_config().file_extensions
         else:
-            extensions = [".txt"]
+            extensions = (".txt",)
         
-        # Build glob pattern for each extension
-        parsed_events = []
-        for ext in extensions:
-            for file_path in events_dir.glob(f"*{ext}"):
+        # Directory entries carry the file type, so no per-file stat is needed.
+        # Hidden files are skipped, as they were with glob.
+        with os.scandir(events_dir) as entries:
+            file_paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(extensions)
+                and not entry.name.startswith('.')
+                and entry.is_file()
+            ]
+        
+        # Reuse cached results for files that have not changed since they were parsed
+        cached_events: Dict[Path, ParsedEvent] = {}
+        stamps: Dict[Path, List[int]] = {}
+        if self._parse_cache is not None:
+            for file_path in file_paths:
                 try:
-                    parsed_event = self.parse_event_file(file_path)
-                    parsed_events.append(parsed_event)
-                except Exception as e:
-                    print(f"Warning: Failed to parse {file_path}: {e}")
+                    stat = file_path.stat()
+                except OSError:
                     continue
+                stamps[file_path] = [stat.st_mtime_ns, stat.st_size]
+                cached_event = self._get_cached_event(file_path, stamps[file_path])
+                if cached_event is not None:
+                    cached_events[file_path] = cached_event
+        
+        paths_to_parse = [file_path for file_path in file_paths if file_path not in cached_events]
+        results = self._iter_parse_results(paths_to_parse)
+        
+        # Parse results come in the order of paths_to_parse, cached files fill the gaps
+        for file_path in file_paths:
+            parsed_event = cached_events.pop(file_path, None)
+            if parsed_event is None:
+                _, parsed_event, error = next(results)
+                if parsed_event is None:
+                    print(f"Warning: Failed to parse {file_path}: {error}")
+                    continue
+                if file_path in stamps:
+                    self._cache_event(parsed_event, stamps[file_path])
+            yield parsed_event
+    
+    def _iter_parse_results(self, file_paths: List[Path]) -> Iterator[Tuple[Path, Optional[ParsedEvent], str]]:
+        """
+        Parse event files in order, in worker processes for larger batches.
+        
+        Args:
+            file_paths: Paths to the event files to parse
+            
+        Yields:
+            Tuple of (file path, ParsedEvent or None, error message) per file
+        """
+        parsed_count = 0
+        cpu_count = os.cpu_count() or 1
+        if len(file_paths) >= PARALLEL_PARSE_MIN_FILES and cpu_count > 1:
+            # Files are independent, so parse them in worker processes
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=cpu_count,
+                    initializer=_init_parse_worker,
+                    initargs=(self,)
+                ) as executor:
+                    for result in executor.map(_parse_one, file_paths, chunksize=8):
+                        parsed_count += 1
+                        yield result
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Warning: Parallel parsing failed ({e}), parsing files sequentially")
         
-        return parsed_events
+        # Files the workers did not get to are parsed here
+        for file_path in file_paths[parsed_count:]:
+            yield self._try_parse_event_file(file_path)
+    
+    def _try_parse_event_file(self, file_path: Path) -> Tuple[Path, Optional[ParsedEvent], str]:
+        """
+        Parse a single event file, capturing any error.
+        
+        Args:
+            file_path: Path to the event file to parse
+            
+        Returns:
+            Tuple of (file path, ParsedEvent or None, error message)
+        """
+        try:
+            return file_path, self.parse_event_file(file_path), ""
+        except Exception as e:
+            return file_path, None, str(e)
     
     def get_ai_blocks_summary(self, parsed_events: List[ParsedEvent]) -> Dict[str, int]:
         """
@@ -300,11 +836,8 @@ class EventParser:
         Returns:
             Dictionary mapping model names to their usage count
         """
-        summary: Dict[str, int] = {}
-        
-        for event in parsed_events:
-            for block in event.ai_blocks:
-                model_name = block.model_name
-                summary[model_name] = summary.get(model_name, 0) + 1
-        
-        return summary 
\ No newline at end of file
+        return dict(Counter(
+            block.model_name
+            for event in parsed_events
+            for block in event.ai_blocks
+        ))
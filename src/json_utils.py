@@ -0,0 +1,91 @@
+"""
+JSON Utilities for CK3 AI Weight Generator
+
+This module contains helpers for reading and writing JSON files. When the
+optional ``orjson`` package is installed it is used for decoding and
+encoding, otherwise the standard library ``json`` module is used.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def decode_json(data: bytes) -> Any:
+    """
+    Decode JSON data from raw bytes.
+
+    Args:
+        data: UTF-8 encoded JSON document
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data.decode('utf-8'))
+
+
+def load_json(file_path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    The file is read as raw bytes and decoded in one step. Decoding errors
+    raise ``json.JSONDecodeError`` (``orjson.JSONDecodeError`` is a subclass).
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Decoded JSON data
+    """
+    return decode_json(Path(file_path).read_bytes())
+
+
+def encode_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Encode data as UTF-8 JSON.
+
+    Args:
+        data: JSON serializable data
+        indent: Whether to indent the output by two spaces
+
+    Returns:
+        Encoded JSON document, non-ASCII characters are kept as UTF-8
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(file_path: Path, data: Any, indent: bool = True) -> None:
+    """
+    Write data to a JSON file atomically.
+
+    The document is written to a temporary file next to the target which
+    then replaces it, so an interrupted write never leaves a partial file.
+
+    Args:
+        file_path: Path to the JSON file
+        data: JSON serializable data
+        indent: Whether to indent the output by two spaces
+    """
+    file_path = Path(file_path)
+    temp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        temp_path.write_bytes(encode_json(data, indent))
+        os.replace(temp_path, file_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
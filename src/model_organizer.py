@@ -6,46 +6,75 @@ It provides functions to validate, list, and manage traits and character models.
 """
 
 import json
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 from .ai_model_manager import AIModelManager, TraitManager
 
 
+# Trait categories used in the model documentation, a trait can be in several
+TRAIT_CATEGORIES: Dict[str, FrozenSet[str]] = {
+    'personality': frozenset(['ambitious', 'content', 'greedy', 'generous', 'wrathful', 'calm']),
+    'education': frozenset(['historian', 'scholar', 'diplomat', 'zealous', 'cynical']),
+    'combat': frozenset(['brave', 'craven', 'berserker', 'reckless', 'patient']),
+    'social': frozenset(['gregarious', 'shy', 'paranoid', 'trusting', 'humble']),
+    'religious': frozenset(['zealous', 'cynical'])
+}
+
+
 class ModelOrganizer:
     """Utility class for organizing and managing AI models and traits."""
     
-    def __init__(self):
-        """Initialize the model organizer."""
-        self.ai_manager = AIModelManager()
+    def __init__(self, ai_manager: Optional[AIModelManager] = None):
+        """
+        Initialize the model organizer.
+        
+        Args:
+            ai_manager: Existing AIModelManager to reuse (optional, a new one
+                is created and loaded from disk if omitted)
+        """
+        self.ai_manager = ai_manager if ai_manager is not None else AIModelManager()
         self.trait_manager = self.ai_manager.get_trait_manager()
     
-    def validate_trait_references(self) -> Dict[str, List[str]]:
+    def validate_trait_references(self, counts_only: bool = False) -> Dict[str, Any]:
         """
         Validate that all trait references in character models exist.
         
+        Args:
+            counts_only: If True, only the number of valid models, models with
+                missing traits and unused traits is returned
+            
         Returns:
-            Dictionary with validation results
+            Dictionary with validation results, or with 'valid_models_count',
+            'missing_traits_count' and 'unused_traits_count' if counts_only
         """
         results: Dict[str, Any] = {
             'missing_traits': [],
             'unused_traits': [],
             'valid_models': []
         }
+        valid_model_count = 0
+        missing_model_count = 0
         
         # Get all available traits
-        available_traits = set(self.trait_manager.list_traits())
+        available_traits = frozenset(self.trait_manager.traits)
         
-        # Check character models
+        # Check character models, collecting used traits in the same pass
+        used_traits: Set[str] = set()
         for model_name, model in self.ai_manager.character_models.items():
-            model_traits = set()
-            
             # Collect all traits referenced in this model
-            for trait_list in model.traits.values():
-                model_traits.update(trait_list)
-            model_traits.update(model.opposite_traits)
+            model_traits = frozenset(chain(*model.traits.values(), model.opposite_traits))
+            used_traits.update(model_traits)
             
             # Check for missing traits
+            if counts_only:
+                if model_traits <= available_traits:
+                    valid_model_count += 1
+                else:
+                    missing_model_count += 1
+                continue
+            
             missing = model_traits - available_traits
             if missing:
                 results['missing_traits'].append({
@@ -55,13 +84,14 @@ class ModelOrganizer:
             else:
                 results['valid_models'].append(model_name)
         
-        # Find unused traits
-        used_traits = set()
-        for model in self.ai_manager.character_models.values():
-            for trait_list in model.traits.values():
-                used_traits.update(trait_list)
-            used_traits.update(model.opposite_traits)
+        if counts_only:
+            return {
+                'valid_models_count': valid_model_count,
+                'missing_traits_count': missing_model_count,
+                'unused_traits_count': len(available_traits - used_traits)
+            }
         
+        # Find unused traits
         results['unused_traits'] = list(available_traits - used_traits)
         
         return results
@@ -105,32 +135,12 @@ class ModelOrganizer:
     
     def _get_trait_categories(self) -> Dict[str, List[str]]:
         """Categorize traits based on their characteristics."""
-        categories: Dict[str, List[str]] = {
-            'personality': [],
-            'education': [],
-            'combat': [],
-            'social': [],
-            'religious': []
-        }
-        
-        # Define trait categories
-        personality_traits = ['ambitious', 'content', 'greedy', 'generous', 'wrathful', 'calm']
-        education_traits = ['historian', 'scholar', 'diplomat', 'zealous', 'cynical']
-        combat_traits = ['brave', 'craven', 'berserker', 'reckless', 'patient']
-        social_traits = ['gregarious', 'shy', 'paranoid', 'trusting', 'humble']
-        religious_traits = ['zealous', 'cynical']
+        categories: Dict[str, List[str]] = {category: [] for category in TRAIT_CATEGORIES}
         
         for trait_name in self.trait_manager.list_traits():
-            if trait_name in personality_traits:
-                categories['personality'].append(trait_name)
-            if trait_name in education_traits:
-                categories['education'].append(trait_name)
-            if trait_name in combat_traits:
-                categories['combat'].append(trait_name)
-            if trait_name in social_traits:
-                categories['social'].append(trait_name)
-            if trait_name in religious_traits:
-                categories['religious'].append(trait_name)
+            for category, category_traits in TRAIT_CATEGORIES.items():
+                if trait_name in category_traits:
+                    categories[category].append(trait_name)
         
         return categories
     
@@ -165,19 +175,8 @@ class ModelOrganizer:
             f.write("## Character Models\n\n")
             f.write(f"Total character models: {summary['character_models']['total_count']}\n\n")
             
-            for model_name, details in summary['character_models']['details'].items():
-                f.write(f"### {model_name.title()}\n\n")
-                f.write(f"**Description**: {details['description']}\n\n")
-                f.write(f"**Base Weight**: {details['base_weight']}\n\n")
-                
-                if details['positive_traits']:
-                    f.write(f"**Positive Traits**: {', '.join(details['positive_traits'])}\n\n")
-                if details['negative_traits']:
-                    f.write(f"**Negative Traits**: {', '.join(details['negative_traits'])}\n\n")
-                if details['opposite_traits']:
-                    f.write(f"**Opposite Traits**: {', '.join(details['opposite_traits'])}\n\n")
-                
-                f.write(f"**Modifiers**: {details['modifier_count']} conditions\n\n")
+            for model in self.ai_manager.character_models.values():
+                f.write(model.documentation)
         
         print(f"Documentation exported to {output_file}")
     
@@ -5,7 +5,13 @@ Quick CK3 AI Weight Check
 Simple script to quickly display current weight values for all AI models.
 """
 
-from ai_model_manager import AIModelManager
+import sys
+from pathlib import Path
+
+# Run as a script, so put the project root on the path to import the src package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ai_model_manager import AIModelManager
 
 
 def main():
@@ -22,11 +28,7 @@ def main():
     print()
     
     # Calculate and display weights for each model
-    for model_name in ai_manager.list_character_models():
-        character_model = ai_manager.get_character_model(model_name)
-        if not character_model:
-            continue
-        
+    for model_name, character_model in ai_manager.iter_character_models():
         # Calculate total weight
         total_weight = character_model.base_weight
         
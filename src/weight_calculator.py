@@ -16,9 +16,15 @@ from .ai_model_manager import AIModel, AIModelManager, CharacterModel, TraitMana
 class WeightCalculator:
     """Calculates and displays complete weight values for AI models."""
     
-    def __init__(self):
-        """Initialize the weight calculator with AI model manager."""
-        self.ai_manager = AIModelManager()
+    def __init__(self, ai_manager: Optional[AIModelManager] = None):
+        """
+        Initialize the weight calculator with AI model manager.
+        
+        Args:
+            ai_manager: Existing AIModelManager to reuse (optional, a new one
+                is created and loaded from disk if omitted)
+        """
+        self.ai_manager = ai_manager if ai_manager is not None else AIModelManager()
         self.trait_manager = self.ai_manager.get_trait_manager()
     
     def calculate_model_weights(self, model_name: str) -> Dict[str, Any]:
@@ -35,6 +41,19 @@ class WeightCalculator:
         if not character_model:
             return {"error": f"Model '{model_name}' not found"}
         
+        return self._build_weight_breakdown(model_name, character_model)
+    
+    def _build_weight_breakdown(self, model_name: str, character_model: CharacterModel) -> Dict[str, Any]:
+        """
+        Build the weight breakdown of an already looked up character model.
+        
+        Args:
+            model_name: Name of the model
+            character_model: Character model to calculate weights for
+            
+        Returns:
+            Dictionary containing weight breakdown
+        """
         # Initialize weight breakdown
         breakdown = {
             "model_name": model_name,
@@ -49,9 +68,17 @@ class WeightCalculator:
             "total_weight": character_model.base_weight
         }
         
+        positive_traits = character_model.traits.get('positive', [])
+        negative_traits = character_model.traits.get('negative', [])
+        
+        # Look up every referenced trait in one call
+        traits = self.trait_manager.get_traits(
+            [*positive_traits, *negative_traits, *character_model.opposite_traits]
+        )
+        
         # Calculate positive trait contributions
-        for trait_name in character_model.traits.get('positive', []):
-            trait = self.trait_manager.get_trait(trait_name)
+        for trait_name in positive_traits:
+            trait = traits[trait_name]
             if trait:
                 trait_weight = trait.weight
                 breakdown["trait_contributions"]["positive_traits"][trait_name] = {
@@ -71,8 +98,8 @@ class WeightCalculator:
                     breakdown["total_weight"] += mod_weight
         
         # Calculate negative trait contributions (NOT conditions)
-        for trait_name in character_model.traits.get('negative', []):
-            trait = self.trait_manager.get_trait(trait_name)
+        for trait_name in negative_traits:
+            trait = traits[trait_name]
             if trait:
                 trait_weight = -trait.weight  # Negative because it's a NOT condition
                 breakdown["trait_contributions"]["negative_traits"][trait_name] = {
@@ -84,7 +111,7 @@ class WeightCalculator:
         
         # Calculate opposite trait contributions (strong negative)
         for trait_name in character_model.opposite_traits:
-            trait = self.trait_manager.get_trait(trait_name)
+            trait = traits[trait_name]
             if trait:
                 trait_weight = -trait.weight  # Negative because it's a NOT condition
                 breakdown["trait_contributions"]["opposite_traits"][trait_name] = {
@@ -120,7 +147,11 @@ class WeightCalculator:
         if "error" in breakdown:
             return 0
         
-        # Convert to integer, rounding down to lowest integer
+        return self._integer_weight(breakdown)
+    
+    @staticmethod
+    def _integer_weight(breakdown: Dict[str, Any]) -> int:
+        """Get the total weight of a breakdown, rounded down to an integer."""
         weight = breakdown["total_weight"]
         if isinstance(weight, float):
             weight = int(weight)  # This rounds down to the lowest integer
@@ -136,8 +167,8 @@ class WeightCalculator:
             Dictionary mapping model names to integer weight values
         """
         weights = {}
-        for model_name in self.ai_manager.list_character_models():
-            weights[model_name] = self.get_model_weight(model_name)
+        for model_name, character_model in self.ai_manager.iter_character_models():
+            weights[model_name] = self._integer_weight(self._build_weight_breakdown(model_name, character_model))
         return weights
     
     def calculate_all_weights(self) -> Dict[str, Any]:
@@ -149,8 +180,8 @@ class WeightCalculator:
         """
         all_models = {}
         
-        for model_name in self.ai_manager.list_character_models():
-            all_models[model_name] = self.calculate_model_weights(model_name)
+        for model_name, character_model in self.ai_manager.iter_character_models():
+            all_models[model_name] = self._build_weight_breakdown(model_name, character_model)
         
         return all_models
     
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for the AI model manager.
+"""
+
+import dataclasses
+import sys
+
+from src.ai_model_manager import AIModelManager, TraitInteraction
+
+
+def test_interaction_invalidates_models():
+    """Test that added interactions invalidate the models they can affect."""
+    print("Testing cache invalidation by added interactions...")
+
+    try:
+        manager = AIModelManager()
+        model_count = len(manager.character_models)
+        character_model = next(iter(manager.character_models.values()))
+        trait_name = character_model.traits['positive'][0]
+
+        manager.add_custom_trait_interaction(TraitInteraction(
+            trait_combination=[trait_name],
+            interaction_type="synergy",
+            weight_modifier=5,
+            description="Test interaction"
+        ))
+        cached_models = manager.get_cache_info()['cached_models']
+        if cached_models == model_count:
+            print(f"❌ No model invalidated by an interaction on '{trait_name}'")
+            return False
+
+        # An interaction without traits applies to every model
+        manager.rebuild_models()
+        manager.add_custom_trait_interaction(TraitInteraction(
+            trait_combination=[],
+            interaction_type="synergy",
+            weight_modifier=5,
+            description="Test interaction without traits"
+        ))
+        if manager.get_cache_info()['cached_models'] != 0 or manager.is_cache_valid():
+            print("❌ Interaction without traits did not invalidate every model")
+            return False
+
+        print("✅ Added interactions invalidate the affected models")
+        return True
+    except Exception as e:
+        print(f"❌ Interaction invalidation test failed: {e}")
+        return False
+
+
+def test_forced_rebuild_uses_changed_traits():
+    """Test that a forced rebuild picks up changed trait definitions."""
+    print("\nTesting forced rebuild after a trait change...")
+
+    try:
+        manager = AIModelManager()
+        character_model = next(iter(manager.character_models.values()))
+        trait_name = character_model.traits['positive'][0]
+        trait = manager.trait_manager.traits[trait_name]
+        original_total_weight = manager.validate_all_models()[character_model.name].total_trait_weight
+        manager.trait_manager.traits[trait_name] = dataclasses.replace(trait, weight=trait.weight + 7)
+
+        manager.rebuild_models(force=True)
+        weights = [
+            modifier.weight_adjustment
+            for modifier in manager.get_model(character_model.name).parameters.modifiers
+            if modifier.condition_identifier == "HAS_TRAIT"
+            and modifier.condition_values == {"trait_name": trait_name}
+        ]
+        if weights != [trait.weight + 7]:
+            print(f"❌ Unexpected HAS_TRAIT weights after rebuild: {weights}")
+            return False
+
+        total_weight = manager.validate_all_models()[character_model.name].total_trait_weight
+        if total_weight != original_total_weight + 7:
+            print(f"❌ Stale total trait weight after rebuild: {total_weight}")
+            return False
+
+        print("✅ Forced rebuild uses the changed trait weight")
+        return True
+    except Exception as e:
+        print(f"❌ Forced rebuild test failed: {e}")
+        return False
+
+
+def test_validation_results_are_copies():
+    """Test that changing returned validation results does not affect later calls."""
+    print("\nTesting cached validation results...")
+
+    try:
+        manager = AIModelManager()
+        model_name = next(iter(manager.character_models))
+        manager.validate_all_models()[model_name].warnings.append("changed by caller")
+
+        if "changed by caller" in manager.validate_all_models()[model_name].warnings:
+            print("❌ Caller change leaked into the cached validation result")
+            return False
+
+        print("✅ Validation results are copied for each call")
+        return True
+    except Exception as e:
+        print(f"❌ Validation result test failed: {e}")
+        return False
+
+
+def main():
+    """Main test function."""
+    print("CK3 AI Model Manager Test")
+    print("=" * 40)
+
+    tests = [
+        test_interaction_invalidates_models,
+        test_forced_rebuild_uses_changed_traits,
+        test_validation_results_are_copies
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        if test():
+            passed += 1
+
+    print(f"\nTest Results: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("✅ All tests passed!")
+        return 0
+    else:
+        print("❌ Some tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
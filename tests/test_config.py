@@ -3,7 +3,9 @@
 Test script for the new CK3 configuration system.
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 from src.config_manager import ConfigManager
@@ -109,6 +111,37 @@ def test_mod_discovery():
         return False
 
 
+def test_lazy_config_access():
+    """Test that config attributes load on access and a missing config fails early."""
+    print("\nTesting lazy configuration access...")
+    
+    try:
+        config_manager = ConfigManager()
+        if config_manager.program_config is None or not isinstance(config_manager.config_data, dict):
+            print("❌ Configuration attributes not loaded on access")
+            return False
+        
+        # Without a user or default config the constructor fails, not a later getter
+        current_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                ConfigManager()
+                print("❌ Missing configuration not reported at construction")
+                return False
+            except FileNotFoundError:
+                pass
+            finally:
+                os.chdir(current_dir)
+        
+        print("✅ Configuration attributes load on access")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Lazy configuration test failed: {e}")
+        return False
+
+
 def main():
     """Main test function."""
     print("CK3 Configuration System Test")
@@ -118,7 +151,8 @@ def main():
         test_config_loading,
         test_descriptor_parsing,
         test_path_resolution,
-        test_mod_discovery
+        test_mod_discovery,
+        test_lazy_config_access
     ]
     
     passed = 0
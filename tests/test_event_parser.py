@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script for the CK3 event parser.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from src.event_parser import EventParser
+
+
+SAMPLE_EVENT = """# AI-MODEL-LIB
+namespace = test_event
+
+test_event.0001 = {
+\toption = {
+\t\tname = test_event.0001.a
+\t\tai_chance = {
+\t\t\t# AI-START using: {aggressive}
+\t\t\t# keep this comment
+\t\t\tbase = 10
+\t\t\t# AI-END
+\t\t}
+\t}
+\toption = {
+\t\tname = test_event.0001.b
+\t\tai_chance = {
+\t\t\t# AI-START
+\t\t\t# using: {diplomatic}
+\t\t\tbase = 5
+\t\t\t# AI-END
+\t\t}
+\t}
+\toption = {
+\t\t# AI-END
+\t\tname = test_event.0001.c
+\t}
+}
+"""
+
+
+def _parse_sample(parser: EventParser, text: str):
+    """Write the text to a temporary event file and parse it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        event_file = Path(temp_dir) / "test_event.txt"
+        event_file.write_text(text, encoding="utf-8")
+        return parser.parse_event_file(event_file)
+
+
+def test_block_extraction():
+    """Test extraction of AI blocks and their line numbers."""
+    print("Testing AI block extraction...")
+
+    try:
+        parsed_event = _parse_sample(EventParser(), SAMPLE_EVENT)
+        blocks = parsed_event.ai_blocks
+
+        if not parsed_event.has_ai_lib:
+            print("❌ AI-MODEL-LIB marker not detected")
+            return False
+
+        if [block.model_name for block in blocks] != ["aggressive", "diplomatic"]:
+            print(f"❌ Unexpected models: {[block.model_name for block in blocks]}")
+            return False
+
+        first, second = blocks
+        if (first.start_line, second.start_line) != (7, 16):
+            print("❌ Unexpected ai_chance start lines")
+            return False
+
+        if (first.ai_block_start_line, first.ai_block_end_line) != (9, 10):
+            print("❌ Unexpected AI block content range")
+            return False
+
+        if tuple(first.original_lines or ()) != (9, 10) or first.content != "\t\t\t# keep this comment\n\t\t\tbase = 10":
+            print("❌ Unexpected AI block content")
+            return False
+
+        if tuple(first.preserved_comments or ()) != ("# keep this comment",):
+            print(f"❌ Unexpected preserved comments: {first.preserved_comments}")
+            return False
+
+        print("✅ AI blocks extracted correctly")
+        return True
+    except Exception as e:
+        print(f"❌ AI block extraction failed: {e}")
+        return False
+
+
+def test_marker_variants():
+    """Test case-insensitive markers and blocks without a model name."""
+    print("\nTesting marker variants...")
+
+    try:
+        text = (
+            "# ai-model-lib\n"
+            "ai_chance = {\n"
+            "#ai-start\n"
+            "base = 1\n"
+            "#ai-end\n"
+            "}\n"
+            "ai_chance = {\n"
+            "#   AI-START using: { scholarly }\n"
+            "#   AI-END\n"
+            "}"
+        )
+        parsed_event = _parse_sample(EventParser(), text)
+        blocks = parsed_event.ai_blocks
+
+        if len(blocks) != 1 or blocks[0].model_name != "scholarly":
+            print(f"❌ Unexpected blocks: {blocks}")
+            return False
+
+        if blocks[0].start_line != 7 or blocks[0].content != "":
+            print("❌ Unexpected ai_chance start line for the last block")
+            return False
+
+        print("✅ Marker variants handled correctly")
+        return True
+    except Exception as e:
+        print(f"❌ Marker variant parsing failed: {e}")
+        return False
+
+
+def test_files_without_library_marker():
+    """Test that files without AI-MODEL-LIB are not searched for AI blocks."""
+    print("\nTesting files without the library marker...")
+
+    try:
+        text = SAMPLE_EVENT.replace("# AI-MODEL-LIB\n", "")
+        parsed_event = _parse_sample(EventParser(), text)
+
+        if parsed_event.has_ai_lib or parsed_event.ai_blocks:
+            print("❌ AI blocks extracted from a file without AI-MODEL-LIB")
+            return False
+
+        print("✅ File without library marker skipped")
+        return True
+    except Exception as e:
+        print(f"❌ Parsing file without library marker failed: {e}")
+        return False
+
+
+def test_parse_cache():
+    """Test that unchanged files are served from the parse cache."""
+    print("\nTesting the parse cache...")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            events_dir = Path(temp_dir) / "events"
+            events_dir.mkdir()
+            (events_dir / "test_event.txt").write_text(SAMPLE_EVENT, encoding="utf-8")
+            cache_file = Path(temp_dir) / "cache.json"
+
+            parser = EventParser()
+            parser.load_parse_cache(cache_file)
+            parsed_events = parser.parse_events_directory(events_dir)
+            parser.save_parse_cache()
+
+            cached_parser = EventParser()
+            cached_parser.load_parse_cache(cache_file)
+            cached_parser.parse_event_file = None  # Any parse attempt would fail
+            cached_events = cached_parser.parse_events_directory(events_dir)
+
+            if cached_events != parsed_events:
+                print("❌ Cached results differ from parsed results")
+                return False
+
+            # Nothing was parsed, so the cache file is not written again
+            cache_file.unlink()
+            cached_parser.save_parse_cache()
+            if cache_file.exists():
+                print("❌ Unchanged parse cache was rewritten")
+                return False
+
+        print("✅ Unchanged file loaded from the parse cache")
+        return True
+    except Exception as e:
+        print(f"❌ Parse cache test failed: {e}")
+        return False
+
+
+def main():
+    """Main test function."""
+    print("CK3 Event Parser Test")
+    print("=" * 40)
+
+    tests = [
+        test_block_extraction,
+        test_marker_variants,
+        test_files_without_library_marker,
+        test_parse_cache
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        if test():
+            passed += 1
+
+    print(f"\nTest Results: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("✅ All tests passed!")
+        return 0
+    else:
+        print("❌ Some tests failed!")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())